@@ -2,11 +2,25 @@
 #   Date: 13/08/2025
 #   File: classes/algorithm.py
 
-
-import sqlite3
+import json
+import re
+from .connection_manager import ConnectionManager
+from .catalog import AlgorithmCatalog
 
 class Algorithm:    
     db_path = "cubelab.db"
+
+    # Rules shared by the add/edit dialogs and the bulk importer
+    VALID_MOVES = {
+        'U', 'D', 'L', 'R', 'F', 'B', # base moves
+        'U2', 'D2', 'L2', 'R2', 'F2', 'B2', # 2 moves
+        "U'", "D'", "L'", "R'", "F'", "B'", # prime moves
+        "U2'", "D2'", "L2'", "R2'", "F2'", "B2'" # 2 prime moves
+    }
+    MAX_NAME_LENGTH = 32
+    MAX_TAGS = 10
+    MAX_TAG_LENGTH = 16
+
     # name (str or None): Algorithm name, string for easy matching/display
     # notation (str or None): Algorithm notation, string for move sequences
     # tags (list of str or None): Tags for categorization, list allows multiple tags
@@ -16,138 +30,151 @@ class Algorithm:
         self.notation = notation
         self.tags = tags or []
 
+    # Databases that have the algorithms_fts search index, looked up once per database file
+    _fts_available = {}
+
+    # Per-algorithm practice stats (kept current by triggers), only joined in for the sort orders that need them
+    _SOLVE_STATS_JOIN = """
+        LEFT JOIN algorithm_stats stats ON stats.algorithm_id = a.id
+    """
+    # sort_order: (extra join, ORDER BY clause), names break every tie in A-Z order
+    SORT_ORDERS = {
+        "asc": ("", "a.sort_key, a.name COLLATE NOCASE"),
+        "desc": ("", "a.sort_key DESC, a.name COLLATE NOCASE DESC"),
+        "most_solves": (_SOLVE_STATS_JOIN, "COALESCE(stats.solve_count, 0) DESC, a.sort_key"),
+        "last_practiced": (_SOLVE_STATS_JOIN, "stats.last_timestamp DESC NULLS LAST, a.sort_key"),
+        "best_pb": (_SOLVE_STATS_JOIN, "stats.best ASC NULLS LAST, a.sort_key"),
+        # Cached ao12 PB (WCA rules, DNFs count), stale rows are refreshed before sorting
+        "best_ao12": (_SOLVE_STATS_JOIN, "stats.ao12_pb ASC NULLS LAST, a.sort_key"),
+    }
+
+    # notation (str): Space separated moves to check
+    # Returns: list of str, the moves that are not valid (empty if the notation is valid)
+    @staticmethod
+    def find_invalid_moves(notation: str) -> list:
+        """
+        Function: Check each move in a notation (case-insensitive)
+        Input: notation (str)
+        Outputs: List of invalid moves
+        """
+        return [move for move in notation.split() if move.upper() not in Algorithm.VALID_MOVES]
+
+    # name (str): Algorithm name to make a sort key for
+    # Returns: str, lowercase name with every number zero-padded
+    @staticmethod
+    def make_sort_key(name: str) -> str:
+        """
+        Function: Make the stored sort key for a name, so case is ignored and numbers sort by value (ZBLL 2 before ZBLL 10)
+        Input: name (str)
+        Outputs: Sort key (str)
+        """
+        return re.sub(r"\d+", lambda match: match.group().zfill(10), name.casefold())
+
     # search_query (str): Text to search for, string for pattern matching
     # filter_tags (set of str): Tags to filter by, set for uniqueness/fast lookup
-    # sort_order (str): 'asc' or 'desc', string for clarity
+    # sort_order (str): a key of SORT_ORDERS or 'relevance', string for clarity
+    # tag_mode (str): 'any' or 'all', whether an algorithm needs one or every tag in filter_tags
+    # exclude_tags (set of str or None): Tags to leave out, set for fast lookup
     # Returns: list of str, algorithm names
-    # Data Source: cubelab.db, tables: algorithms, tags, algorithm_tags
-    def get_algorithms_with_filters(self, search_query: str, filter_tags: set, sort_order: str) -> list:
+    # Data Source: cubelab.db, tables: algorithms, algorithms_fts, algorithm_stats; AlgorithmCatalog for tags
+    def get_algorithms_with_filters(self, search_query: str, filter_tags: set, sort_order: str,
+                                    tag_mode: str = "any", exclude_tags: set = None, with_stats: bool = False) -> list:
         """
-        Function: Get algorithms based on the tags that the user has selected using a quicksort algorithm
-        Input: search_query (str), filter_tags (set), sort_order (str)
-        Outputs: List of algorithm names
+        Function: Get algorithms based on the search and the tags that the user has selected, sorted by the database
+        Input: search_query (str), filter_tags (set), sort_order (str), tag_mode (str), exclude_tags (set), with_stats (bool)
+        Outputs: List of algorithm names ('relevance' keeps the best search matches first), or with_stats
+                 a list of (name, solve_count, pb, last_practiced) read in the same query
         """
         if filter_tags is None:
             filter_tags = set()
         
-        with sqlite3.connect(self.db_path) as conn:
+        if sort_order == "best_ao12":
+            # Imported here, timer_util imports this module
+            from .timer_util import TimerUtil
+            TimerUtil().refresh_stale_averages()
+        
+        # Tag filters are resolved from the catalog's bitmap index rather than joined in SQL
+        tag_ids = None
+        if filter_tags or exclude_tags:
+            tag_ids = AlgorithmCatalog.get(self.db_path).filter_ids(filter_tags, tag_mode, exclude_tags)
+            if not tag_ids:
+                return []
+        
+        with ConnectionManager.get_connection(self.db_path) as conn:
             cursor = conn.cursor()
             
-            tags = list(filter_tags)
-            has_tags = len(tags) > 0
-            has_search = bool(search_query)
+            joins = []
+            where_parts = []
+            params = []
+            ranked = False
             
-            if has_tags:
-                placeholders = ",".join(["?"] * len(tags))
-                where_parts = [f"t.name IN ({placeholders})"]
-                params = tags[:]
-                
-                if has_search:
+            if search_query:
+                if len(search_query) >= 3 and self._has_search_index(cursor):
+                    # Quote the query so it is matched as one substring rather than FTS5 query syntax
+                    joins.append("JOIN algorithms_fts ON algorithms_fts.rowid = a.id")
+                    where_parts.append("algorithms_fts MATCH ?")
+                    params.append('"' + search_query.replace('"', '""') + '"')
+                    ranked = True
+                else:
+                    # Trigrams need at least 3 characters, shorter queries use a plain scan
                     where_parts.append("(LOWER(a.name) LIKE ? OR LOWER(a.notation) LIKE ?)")
                     params.extend([f"%{search_query}%", f"%{search_query}%"])
-                
-                where_clause = " AND ".join(where_parts)
-                sql = f"""
-                    SELECT DISTINCT a.name
-                    FROM algorithms a
-                    JOIN algorithm_tags at ON at.algorithm_id = a.id
-                    JOIN tags t ON t.id = at.tag_id
-                    WHERE {where_clause}
-                """
-                cursor.execute(sql, params)
-                results = [r[0] for r in cursor.fetchall()]
+            
+            if tag_ids is not None:
+                # Passed as one JSON array so any number of ids is a single parameter
+                where_parts.append("a.id IN (SELECT value FROM json_each(?))")
+                params.append(json.dumps(tag_ids))
+            
+            if sort_order == "relevance" and ranked:
+                order_by = "algorithms_fts.rank, a.sort_key"
             else:
-                if has_search:
-                    cursor.execute(
-                        f"""
-                        SELECT a.name
-                        FROM algorithms a
-                        WHERE LOWER(a.name) LIKE ? OR LOWER(a.notation) LIKE ?
-                        """,
-                        (f"%{search_query}%", f"%{search_query}%")
-                    )
-                    results = [r[0] for r in cursor.fetchall()]
-                else:
-                    cursor.execute("SELECT name FROM algorithms")
-                    results = [r[0] for r in cursor.fetchall()]
+                sort_join, order_by = self.SORT_ORDERS.get(sort_order, self.SORT_ORDERS["asc"])
+                if sort_join:
+                    joins.append(sort_join)
             
-            sorted_results = self._quicksort(results)
+            columns = "a.name"
+            if with_stats:
+                # Counts come from the trigger-maintained stats table, not one query per algorithm
+                if self._SOLVE_STATS_JOIN not in joins:
+                    joins.append(self._SOLVE_STATS_JOIN)
+                columns += ", COALESCE(stats.solve_count, 0), stats.best, stats.last_timestamp"
             
-            # Reverse if descending order
-            if sort_order == "desc":
-                sorted_results.reverse()
-                
-            return sorted_results
+            sql = f"SELECT {columns} FROM algorithms a {' '.join(joins)}"
+            if where_parts:
+                sql += " WHERE " + " AND ".join(where_parts)
+            sql += f" ORDER BY {order_by}"
+            cursor.execute(sql, params)
+            if with_stats:
+                return cursor.fetchall()
+            return [r[0] for r in cursor.fetchall()]
 
-    # array (list of str): List to partition, list allows in-place sorting
-    # low (int): Start index, int for indexing
-    # high (int): End index, int for indexing
-    # Returns: int, partition index
-    def _partition(self, array: list, low: int, high: int) -> int:
+    # cursor (sqlite3.Cursor): Cursor to query the schema with
+    # Returns: bool, True if the algorithms_fts search index exists
+    # Data Source: cubelab.db, table: sqlite_master
+    def _has_search_index(self, cursor) -> bool:
         """
-        Function: Partition function for quicksort
-        Input: array (list), low (int), high (int)
-        Outputs: Partition index (int)
+        Function: Check whether the full-text search index exists (it is skipped when SQLite lacks FTS5)
+        Input: cursor
+        Outputs: True if the index can be queried, false otherwise
         """
-        pivot = array[high]
-
-        i = low - 1
-        for j in range(low, high):
-            if array[j].lower() <= pivot.lower():
-                i = i + 1
-                (array[i], array[j]) = (array[j], array[i])
-
-        (array[i + 1], array[high]) = (array[high], array[i + 1])
-        return i + 1
-
-    # array (list of str): List to sort
-    # Returns: list of str, sorted list
-    def _quicksort(self, array: list, low: int = None, high: int = None) -> list:
-        """
-        Function: Sort array using quicksort algorithm
-        Input: array (list of strings)
-        Outputs: Sorted list
-        """
-        if low is None or high is None:
-            # Make a copy and sort the whole array
-            arr = array.copy()
-            return self._quicksort(arr, 0, len(arr) - 1)
-        if low < high:
-            pi = self._partition(array, low, high)
-            self._quicksort(array, low, pi - 1)
-            self._quicksort(array, pi + 1, high)
-        return array
+        available = Algorithm._fts_available.get(self.db_path)
+        if available is None:
+            cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'algorithms_fts'")
+            available = cursor.fetchone() is not None
+            Algorithm._fts_available[self.db_path] = available
+        return available
 
     # name (str): Algorithm name to look up, string for matching
     # Returns: tuple (notation: str, tags: list of str) or None
-    # Data Source: cubelab.db, tables: algorithms, tags, algorithm_tags
+    # Data Source: AlgorithmCatalog (loaded from cubelab.db, tables: algorithms, tags, algorithm_tags)
     def get_algorithm_details(self, name: str) -> tuple:
         """
         Function: Get algorithm details by name
         Input: name (str)
         Outputs: Tuple of notation and tags
         """
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT notation FROM algorithms WHERE name = ?", (name,))
-            notation_row = cursor.fetchone()
-            if not notation_row:
-                return None
-            
-            notation = notation_row[0]
-
-            cursor.execute(
-                """
-                SELECT tags.name FROM tags
-                JOIN algorithm_tags ON tags.id = algorithm_tags.tag_id
-                JOIN algorithms ON algorithms.id = algorithm_tags.algorithm_id
-                WHERE algorithms.name = ?
-                """,
-                (name,),
-            )
-            tags = [t[0] for t in cursor.fetchall()]
-
-            return notation, tags
+        # Served from the in-memory catalog, which is kept current by the write methods below
+        return AlgorithmCatalog.get(self.db_path).get_details(name)
 
     # self.name (str): Algorithm name, string for matching algorithm with database
     # self.notation (str): Notation, string for moves
@@ -162,53 +189,118 @@ class Algorithm:
         """
         if not self.name or not self.notation:
             raise ValueError("name and notation are required")
-        with sqlite3.connect(self.db_path) as conn:
+        with ConnectionManager.get_connection(self.db_path) as conn:
             cursor = conn.cursor()
-            # Insert algorithm
+            # Ensure tags exist (ignoring blanks and repeats)
+            saved_tags = list(dict.fromkeys(tag.strip() for tag in self.tags if tag.strip()))
+            tag_ids, created_ids = self._resolve_tag_ids(cursor, saved_tags)
+            # Insert algorithm and link its tags
             cursor.execute(
-                "INSERT INTO algorithms (name, notation) VALUES (?, ?)",
-                (self.name, self.notation)
+                "INSERT INTO algorithms (name, notation, sort_key) VALUES (?, ?, ?)",
+                (self.name, self.notation, self.make_sort_key(self.name))
             )
             algorithm_id = cursor.lastrowid
-            # Ensure tags exist and link them
-            for tag in self.tags:
-                tag_name = tag.strip()
-                if not tag_name:
-                    continue
-                cursor.execute("INSERT OR IGNORE INTO tags (name) VALUES (?)", (tag_name,))
-                cursor.execute("SELECT id FROM tags WHERE name = ?", (tag_name,))
-                tag_row = cursor.fetchone()
-                if tag_row:
-                    tag_id = tag_row[0]
-                    cursor.execute(
-                        "INSERT OR IGNORE INTO algorithm_tags (algorithm_id, tag_id) VALUES (?, ?)",
-                        (algorithm_id, tag_id)
-                    )
+            cursor.executemany(
+                "INSERT OR IGNORE INTO algorithm_tags (algorithm_id, tag_id) VALUES (?, ?)",
+                [(algorithm_id, tag_ids[tag]) for tag in saved_tags]
+            )
             conn.commit()
+            catalog = AlgorithmCatalog.get(self.db_path)
+            catalog.remember_tag_ids(created_ids)
+            catalog.put(algorithm_id, self.name, self.notation, saved_tags)
             return algorithm_id
 
+    # cursor (sqlite3.Cursor): Cursor inside the caller's transaction
+    # rows (list of tuple): (name, notation, tags) for each algorithm, already validated
+    # Returns: int, number of algorithms inserted
+    # Data Source: cubelab.db, tables: algorithms, tags, algorithm_tags
+    def insert_many(self, cursor, rows: list) -> int:
+        """
+        Function: Insert a batch of algorithms and their tags with executemany, without committing
+        Input: cursor, rows (list of (name, notation, tags))
+        Outputs: Number of algorithms inserted
+        """
+        if not rows:
+            return 0
+        cursor.executemany(
+            "INSERT INTO algorithms (name, notation, sort_key) VALUES (?, ?, ?)",
+            [(name, notation, self.make_sort_key(name)) for name, notation, _ in rows]
+        )
+        cursor.execute(
+            "SELECT name, id FROM algorithms WHERE name IN (SELECT value FROM json_each(?))",
+            (json.dumps([name for name, _, _ in rows]),)
+        )
+        algorithm_ids = dict(cursor.fetchall())
+        all_tags = list(dict.fromkeys(tag for _, _, tags in rows for tag in tags))
+        tag_ids, _ = self._resolve_tag_ids(cursor, all_tags)
+        cursor.executemany(
+            "INSERT OR IGNORE INTO algorithm_tags (algorithm_id, tag_id) VALUES (?, ?)",
+            [(algorithm_ids[name], tag_ids[tag]) for name, _, tags in rows for tag in tags]
+        )
+        return len(rows)
+
+    # cursor (sqlite3.Cursor): Cursor inside the caller's transaction
+    # names (list of str): Tag names to look up, list so they are resolved together
+    # Returns: tuple (dict of every name to its id, dict of the names that were not cached)
+    # Data Source: AlgorithmCatalog tag ids, then cubelab.db, table: tags
+    def _resolve_tag_ids(self, cursor, names: list) -> tuple:
+        """
+        Function: Get tag ids for names, creating missing tags with one executemany and one SELECT
+        Input: cursor, names (list)
+        Outputs: Tuple of (all ids by name, newly looked up ids by name)
+        """
+        tag_ids = AlgorithmCatalog.get(self.db_path).get_tag_ids(names)
+        missing = [name for name in names if name not in tag_ids]
+        fetched = {}
+        if missing:
+            cursor.executemany("INSERT OR IGNORE INTO tags (name) VALUES (?)", [(name,) for name in missing])
+            cursor.execute("SELECT name, id FROM tags WHERE name IN (SELECT value FROM json_each(?))", (json.dumps(missing),))
+            fetched = dict(cursor.fetchall())
+            tag_ids.update(fetched)
+        return tag_ids, fetched
+
+    # cursor (sqlite3.Cursor): Cursor inside the caller's transaction
+    # tag_ids (list of int): Tags that just lost a link, list so only these are checked
+    # Returns: int, number of tags deleted
+    # Data Source: cubelab.db, table: tags
+    def _delete_unused_tags(self, cursor, tag_ids: list) -> int:
+        """
+        Function: Delete the given tags if their usage count (kept by triggers) has dropped to zero
+        Input: cursor, tag_ids (list)
+        Outputs: Number of tags deleted
+        """
+        if not tag_ids:
+            return 0
+        cursor.executemany(
+            "DELETE FROM tags WHERE id = ? AND usage_count <= 0",
+            [(tag_id,) for tag_id in tag_ids]
+        )
+        return cursor.rowcount
+
     # name (str): Name of algorithm to remove, string for matching algorithm name with database
     # Returns: bool, True if removed, false otherwise
     # Data Source: cubelab.db, tables: algorithms, tags, algorithm_tags
     def remove_algorithm(self, name: str) -> bool:
         """
-        Function: Remove an algorithm by name and cleanup unused tags
+        Function: Remove an algorithm by name and delete the tags only it used
         Input: name
         Outputs: True if removed, false otherwise
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with ConnectionManager.get_connection(self.db_path) as conn:
                 cursor = conn.cursor()
                 cursor.execute("SELECT id FROM algorithms WHERE name = ?", (name,))
                 res = cursor.fetchone()
                 if res:
                     alg_id = res[0]
+                    cursor.execute("SELECT tag_id FROM algorithm_tags WHERE algorithm_id = ?", (alg_id,))
+                    old_tag_ids = [r[0] for r in cursor.fetchall()]
                     cursor.execute("DELETE FROM algorithm_tags WHERE algorithm_id = ?", (alg_id,))
                     cursor.execute("DELETE FROM algorithms WHERE id = ?", (alg_id,))
+                    # Clean up tags that are no longer used
+                    self._delete_unused_tags(cursor, old_tag_ids)
                     conn.commit()
-                    
-                    # Clean up any tags that are no longer used
-                    self.cleanup_unused_tags()
+                    AlgorithmCatalog.get(self.db_path).discard(name)
                     return True
             return False
         except Exception:
@@ -216,12 +308,12 @@ class Algorithm:
     
     def update_algorithm(self, original_name: str, new_name: str, new_notation: str, new_tags: list) -> bool:
         """
-        Function: Update an existing algorithm with new details
+        Function: Update an existing algorithm with new details, only touching the tags that changed
         Input: original_name (str), new_name (str), new_notation (str), new_tags (list)
         Outputs: True if updated successfully, false otherwise
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with ConnectionManager.get_connection(self.db_path) as conn:
                 cursor = conn.cursor()
                 
                 # Get the algorithm ID
@@ -234,43 +326,40 @@ class Algorithm:
                 
                 # Update algorithm name and notation
                 cursor.execute(
-                    "UPDATE algorithms SET name = ?, notation = ? WHERE id = ?",
-                    (new_name, new_notation, algorithm_id)
+                    "UPDATE algorithms SET name = ?, notation = ?, sort_key = ? WHERE id = ?",
+                    (new_name, new_notation, self.make_sort_key(new_name), algorithm_id)
                 )
                 
-                # Remove existing tag associations
-                cursor.execute("DELETE FROM algorithm_tags WHERE algorithm_id = ?", (algorithm_id,))
+                # Compare the new tags (ignoring repeats) with the current links
+                new_tags = list(dict.fromkeys(new_tags))
+                tag_ids, created_ids = self._resolve_tag_ids(cursor, new_tags)
+                cursor.execute("SELECT tag_id FROM algorithm_tags WHERE algorithm_id = ?", (algorithm_id,))
+                old_tag_ids = {r[0] for r in cursor.fetchall()}
+                new_tag_ids = {tag_ids[tag] for tag in new_tags}
+                removed_ids = list(old_tag_ids - new_tag_ids)
                 
-                # Add new tags
-                for tag_name in new_tags:
-                    # Check if tag exists, if not create it
-                    cursor.execute("SELECT id FROM tags WHERE name = ?", (tag_name,))
-                    tag_row = cursor.fetchone()
-                    
-                    if tag_row:
-                        tag_id = tag_row[0]
-                    else:
-                        # Create new tag
-                        cursor.execute("INSERT INTO tags (name) VALUES (?)", (tag_name,))
-                        tag_id = cursor.lastrowid
-                    
-                    # Link algorithm to tag
-                    cursor.execute(
-                        "INSERT INTO algorithm_tags (algorithm_id, tag_id) VALUES (?, ?)",
-                        (algorithm_id, tag_id)
-                    )
+                cursor.executemany(
+                    "DELETE FROM algorithm_tags WHERE algorithm_id = ? AND tag_id = ?",
+                    [(algorithm_id, tag_id) for tag_id in removed_ids]
+                )
+                cursor.executemany(
+                    "INSERT INTO algorithm_tags (algorithm_id, tag_id) VALUES (?, ?)",
+                    [(algorithm_id, tag_id) for tag_id in new_tag_ids - old_tag_ids]
+                )
+                # Clean up tags that are no longer used
+                self._delete_unused_tags(cursor, removed_ids)
                 
                 conn.commit()
-                
-                # Clean up any tags that are no longer used
-                self.cleanup_unused_tags()
+                catalog = AlgorithmCatalog.get(self.db_path)
+                catalog.remember_tag_ids(created_ids)
+                catalog.put(algorithm_id, new_name, new_notation, new_tags)
                 
                 return True
         except Exception:
             return False
     
     # Returns: list of str, all tag names
-    # Data Source: cubelab.db, table: tags
+    # Data Source: AlgorithmCatalog (loaded from cubelab.db, table: tags)
     def get_all_tags(self) -> list:
         """
         Function: Get all tags
@@ -278,16 +367,12 @@ class Algorithm:
         Outputs: List of tags
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute("SELECT name FROM tags")
-                results = [r[0] for r in cursor.fetchall()]
-                return self._quicksort(results)
+            return sorted(AlgorithmCatalog.get(self.db_path).all_tags(), key=self.make_sort_key)
         except Exception:
             return []
     
     # Returns: int, number of tags deleted
-    # Data Source: cubelab.db, tables: tags, algorithm_tags
+    # Data Source: cubelab.db, table: tags
     def cleanup_unused_tags(self) -> int:
         """
         Function: Delete tags that are not linked to any algorithms
@@ -295,25 +380,21 @@ class Algorithm:
         Outputs: Number of tags deleted
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with ConnectionManager.get_connection(self.db_path) as conn:
                 cursor = conn.cursor()
-                # Find tags that have no algorithm associations
-                cursor.execute("""
-                    DELETE FROM tags 
-                    WHERE id NOT IN (
-                        SELECT DISTINCT tag_id 
-                        FROM algorithm_tags
-                    )
-                """)
+                # Usage counts are kept by triggers on algorithm_tags, so no scan of the links is needed
+                cursor.execute("DELETE FROM tags WHERE usage_count <= 0")
                 deleted_count = cursor.rowcount
                 conn.commit()
+                if deleted_count:
+                    AlgorithmCatalog.get(self.db_path).prune_tags()
                 return deleted_count
         except Exception as e:
             print(f"Error cleaning up unused tags: {e}")
             return 0
     
     # Returns: list of str, unused tag names
-    # Data Source: cubelab.db, tables: tags, algorithm_tags
+    # Data Source: cubelab.db, table: tags
     def get_unused_tags(self) -> list:
         """
         Function: Get list of tags that are not linked to any algorithms to delete from the database
@@ -321,31 +402,22 @@ class Algorithm:
         Outputs: List of unused tag names
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with ConnectionManager.get_connection(self.db_path) as conn:
                 cursor = conn.cursor()
-                cursor.execute("""
-                    SELECT name FROM tags 
-                    WHERE id NOT IN (
-                        SELECT DISTINCT tag_id 
-                        FROM algorithm_tags
-                    )
-                """)
+                cursor.execute("SELECT name FROM tags WHERE usage_count <= 0")
                 results = [r[0] for r in cursor.fetchall()]
-                return self._quicksort(results)
+                return sorted(results, key=self.make_sort_key)
         except Exception as e:
             print(f"Error getting unused tags: {e}")
             return []
     
     # name (str): The name to check for existence, string for matching algorithm name to database
     # Returns: bool, True if exists, false otherwise
-    # Data Source: cubelab.db, table: algorithms
+    # Data Source: AlgorithmCatalog (loaded from cubelab.db, table: algorithms)
     def algorithm_exists(self, name: str) -> bool:
         """
         Function: Check if an algorithm exists by name
         Input: name
         Outputs: True if exists, false otherwise
         """
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT 1 FROM algorithms WHERE name=?", (name,))
-            return cursor.fetchone() is not None
+        return AlgorithmCatalog.get(self.db_path).exists(name)
@@ -0,0 +1,89 @@
+#   Name: Kayden Ye
+#   Date: 17/10/2026
+#   File: classes/averages.py
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from .stats import AverageStats, DNF
+
+class AveragesEngine:
+    # Averages shown by the dashboard
+    SIZES = (5, 12, 50, 100)
+    # Windows sorted at a time, so an ao100 over a long history never needs every window in memory at once
+    CHUNK_WINDOWS = 4096
+
+    # rows: list of (id, time_seconds, timestamp, plus_two, dnf), newest first as get_algorithm_times_with_ids returns them
+    # Returns: numpy array of float64, results oldest first with +2 added and DNFs as infinity
+    @staticmethod
+    def results_from_rows(rows: list) -> np.ndarray:
+        """
+        Function: Turn time rows into an array of results with penalties applied
+        Input: rows (list, newest first)
+        Outputs: Array of results, oldest first
+        """
+        if not rows:
+            return np.empty(0, dtype=np.float64)
+        _, times, _, plus_two, dnf = zip(*rows)
+        results = np.asarray(times, dtype=np.float64) + 2.0 * np.asarray(plus_two, dtype=bool)
+        results[np.asarray(dnf, dtype=bool)] = DNF
+        return results[::-1].copy()
+
+    # results: numpy array of float64, results oldest first (DNF as infinity)
+    # size: int, number of solves in the average
+    # Returns: numpy array of float64, the aoN ending at each solve from the size-th on (infinity for a DNF average)
+    @staticmethod
+    def rolling(results: np.ndarray, size: int) -> np.ndarray:
+        """
+        Function: Compute every aoN in the history at once
+        Input: results (array), size (int)
+        Outputs: Array with one average per full window, len(results) - size + 1 long
+        """
+        results = np.asarray(results, dtype=np.float64)
+        if size < 1 or len(results) < size:
+            return np.empty(0, dtype=np.float64)
+
+        trim = AverageStats.trim_for(size)
+        windows = sliding_window_view(results, size)
+        averages = np.empty(len(windows), dtype=np.float64)
+        for start in range(0, len(windows), AveragesEngine.CHUNK_WINDOWS):
+            chunk = np.sort(windows[start:start + AveragesEngine.CHUNK_WINDOWS], axis=1)
+            # A DNF left after trimming makes the mean infinite, which is a DNF average
+            averages[start:start + len(chunk)] = chunk[:, trim:size - trim].mean(axis=1)
+        return averages
+
+    # averages: numpy array of float64, rolling(results[:m], size) for an earlier, shorter history
+    # results: numpy array of float64, the history now (the first m results unchanged)
+    # size: int, number of solves in the average
+    # Returns: numpy array of float64, equal to rolling(results, size)
+    @staticmethod
+    def extend_rolling(averages: np.ndarray, results: np.ndarray, size: int) -> np.ndarray:
+        """
+        Function: Add the averages for solves added since averages was computed, only sorting the new windows
+        Input: averages (array), results (array), size (int)
+        Outputs: Array with one average per full window
+        """
+        if len(averages) == 0:
+            return AveragesEngine.rolling(results, size)
+        # The first new window starts size - 1 results before the first new solve
+        known = len(averages) + size - 1
+        tail = AveragesEngine.rolling(results[known - size + 1:], size)
+        return np.concatenate([averages, tail])
+
+    # results: numpy array of float64, results oldest first (DNF as infinity)
+    # sizes: iterable of int or None, averages to compute, None for SIZES
+    # Returns: dict of int to tuple (best: float or None, current: float or None), DNF for a DNF average
+    @staticmethod
+    def summary(results: np.ndarray, sizes=None) -> dict:
+        """
+        Function: Best and current average for each size
+        Input: results (array), sizes (iterable or None)
+        Outputs: Dictionary of size to (best, current), both None if there are fewer solves than the size
+        """
+        summary = {}
+        for size in sizes or AveragesEngine.SIZES:
+            averages = AveragesEngine.rolling(results, size)
+            if len(averages) == 0:
+                summary[size] = (None, None)
+            else:
+                summary[size] = (float(averages.min()), float(averages[-1]))
+        return summary
@@ -0,0 +1,79 @@
+#   Name: Kayden Ye
+#   Date: 17/10/2026
+#   File: classes/background_loader.py
+
+import threading
+from concurrent.futures import CancelledError, ThreadPoolExecutor
+from .connection_manager import ConnectionManager
+
+class LatestOnlyLoader:
+    # Runs load jobs on a worker thread where only the newest request matters: submitting a new job
+    # cancels the previous one if it has not started, and a finished job that was replaced is thrown away.
+    # Nothing here touches Tk, the UI thread polls for the result (e.g. with after)
+
+    # name: str, worker thread name prefix (str for debugging)
+    # Returns: None
+    def __init__(self, name: str = "cubelab-loader"):
+        # One worker, so a burst of requests runs at most one stale job before the newest
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=name)
+        self._lock = threading.Lock()
+        self._future = None
+
+    # job: function, called as job(*args) on the worker thread
+    # *args: values passed to job
+    # Returns: None
+    def submit(self, job, *args):
+        """
+        Function: Start loading in the background, replacing any request still waiting
+        Input: job (function), *args
+        Outputs: None
+        """
+        with self._lock:
+            if self._future is not None:
+                self._future.cancel()
+            self._future = self._executor.submit(job, *args)
+
+    # Returns: bool, True while the newest request has not been collected by poll
+    def pending(self) -> bool:
+        with self._lock:
+            return self._future is not None
+
+    # Returns: tuple (done: bool, result), result is the job's return value once done
+    def poll(self) -> tuple:
+        """
+        Function: Collect the newest request's result if it has finished (call from the UI thread)
+        Input: None
+        Outputs: Tuple of whether a result is ready and the result (the job's exception is raised here)
+        """
+        with self._lock:
+            future = self._future
+            if future is None or not future.done():
+                return False, None
+            self._future = None
+        try:
+            return True, future.result()
+        except CancelledError:
+            return False, None
+
+    def cancel(self):
+        """
+        Function: Drop the newest request so its result is never applied
+        Input: None
+        Outputs: None
+        """
+        with self._lock:
+            if self._future is not None:
+                self._future.cancel()
+                self._future = None
+
+    def shutdown(self):
+        """
+        Function: Cancel waiting requests and let the worker thread finish, closing its database connections
+        Input: None
+        Outputs: None
+        """
+        self.cancel()
+        # Last job on the worker, jobs that read the database opened connections for this thread that
+        # ConnectionManager would otherwise keep open until the app exits
+        self._executor.submit(ConnectionManager.close_thread_connections)
+        self._executor.shutdown(wait=False)
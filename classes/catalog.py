@@ -0,0 +1,241 @@
+#   Name: Kayden Ye
+#   Date: 17/10/2026
+#   File: classes/catalog.py
+
+import os
+import threading
+from .connection_manager import ConnectionManager
+from .tag_index import TagBitmapIndex
+
+class AlgorithmCatalog:
+    # One catalog per database file, shared by every Algorithm instance
+    _instances = {}
+    _instances_lock = threading.Lock()
+
+    # db_path: str, path to the SQLite database file (str for loading)
+    # Returns: AlgorithmCatalog (shared catalog for that database)
+    @classmethod
+    def get(cls, db_path: str) -> "AlgorithmCatalog":
+        """
+        Function: Get the shared catalog for a database
+        Input: db_path (str)
+        Outputs: AlgorithmCatalog
+        """
+        key = os.path.abspath(db_path)
+        with cls._instances_lock:
+            instance = cls._instances.get(key)
+            if instance is None:
+                instance = cls(db_path)
+                cls._instances[key] = instance
+            return instance
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._lock = threading.RLock()
+        self._loaded = False
+        # name_to_id (dict of str to int): algorithm name to id, dict for lookup by name
+        self.name_to_id = {}
+        # records (dict of int to dict): algorithm id to {"name", "notation", "tags"}, dict for lookup by id
+        self.records = {}
+        # tag_to_ids (dict of str to set of int): tag name to the ids of algorithms with that tag
+        self.tag_to_ids = {}
+        # tag_ids (dict of str to int): tag name to database id, dict so edits skip the SELECT per tag
+        self.tag_ids = {}
+        # tag_index (TagBitmapIndex): per-tag bitsets for combining tag filters
+        self.tag_index = TagBitmapIndex()
+
+    def _ensure_loaded(self):
+        """
+        Function: Load the catalog the first time it is read, or after it was invalidated
+        Input: None
+        Outputs: None
+        """
+        if not self._loaded:
+            self.load()
+
+    # Data Source: cubelab.db, tables: algorithms, tags, algorithm_tags
+    def load(self):
+        """
+        Function: Load every algorithm, tag and link into memory
+        Input: None
+        Outputs: None
+        """
+        with self._lock:
+            # Read only, and not a "with" block, so a load inside a caller's transaction never commits it
+            cursor = ConnectionManager.get_connection(self.db_path).cursor()
+            cursor.execute("SELECT id, name, notation FROM algorithms")
+            algorithms = cursor.fetchall()
+            cursor.execute("SELECT id, name FROM tags")
+            tags = cursor.fetchall()
+            cursor.execute(
+                """
+                SELECT algorithm_tags.algorithm_id, tags.name
+                FROM algorithm_tags
+                JOIN tags ON tags.id = algorithm_tags.tag_id
+                ORDER BY algorithm_tags.algorithm_id, algorithm_tags.tag_id
+                """
+            )
+            links = cursor.fetchall()
+
+            self.name_to_id = {}
+            self.records = {}
+            self.tag_to_ids = {tag: set() for _, tag in tags}
+            self.tag_ids = {tag: tag_id for tag_id, tag in tags}
+            self.tag_index = TagBitmapIndex()
+            for alg_id, name, notation in algorithms:
+                self.name_to_id[name] = alg_id
+                self.records[alg_id] = {"name": name, "notation": notation, "tags": []}
+            for alg_id, tag in links:
+                record = self.records.get(alg_id)
+                if record is None:
+                    continue
+                record["tags"].append(tag)
+                self.tag_to_ids.setdefault(tag, set()).add(alg_id)
+            for alg_id, record in self.records.items():
+                self.tag_index.add(alg_id, record["tags"])
+            self._loaded = True
+
+    def invalidate(self):
+        """
+        Function: Drop the cached data so the next read reloads it from the database
+        Input: None
+        Outputs: None
+        """
+        with self._lock:
+            self._loaded = False
+
+    # name: str, algorithm name to look up
+    # Returns: tuple (notation: str, tags: list of str) or None
+    def get_details(self, name: str):
+        """
+        Function: Get an algorithm's notation and tags by name
+        Input: name (str)
+        Outputs: Tuple of notation and tags, or None if the algorithm does not exist
+        """
+        with self._lock:
+            self._ensure_loaded()
+            alg_id = self.name_to_id.get(name)
+            if alg_id is None:
+                return None
+            record = self.records[alg_id]
+            return record["notation"], list(record["tags"])
+
+    # name: str, algorithm name to look up
+    # Returns: int or None, algorithm id
+    def get_id(self, name: str):
+        with self._lock:
+            self._ensure_loaded()
+            return self.name_to_id.get(name)
+
+    # name: str, algorithm name to check
+    # Returns: bool, True if an algorithm has this name
+    def exists(self, name: str) -> bool:
+        with self._lock:
+            self._ensure_loaded()
+            return name in self.name_to_id
+
+    # Returns: list of str, every tag name
+    def all_tags(self) -> list:
+        with self._lock:
+            self._ensure_loaded()
+            return list(self.tag_to_ids)
+
+    # include: set of str, tags to filter by
+    # mode: str, 'any' or 'all' (str for OR or AND across the included tags)
+    # exclude: set of str, tags to leave out
+    # Returns: list of int, ids of the matching algorithms
+    def filter_ids(self, include: set, mode: str = "any", exclude: set = None) -> list:
+        """
+        Function: Find the algorithms matching a tag filter using the bitmap index
+        Input: include (set), mode (str), exclude (set)
+        Outputs: List of algorithm ids
+        """
+        with self._lock:
+            self._ensure_loaded()
+            return TagBitmapIndex.ids(self.tag_index.query(include, mode, exclude))
+
+    # names: list of str, tag names to look up
+    # Returns: dict of str to int, ids for the names that are cached
+    def get_tag_ids(self, names: list) -> dict:
+        with self._lock:
+            self._ensure_loaded()
+            return {name: self.tag_ids[name] for name in names if name in self.tag_ids}
+
+    # tag_ids: dict of str to int, tags that were just created or looked up
+    # Returns: None
+    def remember_tag_ids(self, tag_ids: dict):
+        with self._lock:
+            if self._loaded:
+                self.tag_ids.update(tag_ids)
+
+    def prune_tags(self):
+        """
+        Function: Drop tags that no cached algorithm uses (after unused tags are deleted from the database)
+        Input: None
+        Outputs: None
+        """
+        with self._lock:
+            for tag in [tag for tag, ids in self.tag_to_ids.items() if not ids]:
+                del self.tag_to_ids[tag]
+                self.tag_ids.pop(tag, None)
+
+    # alg_id: int, database id of the algorithm
+    # name: str, algorithm name
+    # notation: str, algorithm notation
+    # tags: list of str, the algorithm's tags
+    # Returns: None
+    def put(self, alg_id: int, name: str, notation: str, tags: list):
+        """
+        Function: Add or replace an algorithm after it has been written to the database
+        Input: alg_id (int), name (str), notation (str), tags (list)
+        Outputs: None
+        """
+        with self._lock:
+            if not self._loaded:
+                # Nothing cached yet, the next read loads the new data anyway
+                return
+            self._remove_record(alg_id)
+            self.name_to_id[name] = alg_id
+            self.records[alg_id] = {"name": name, "notation": notation, "tags": list(tags)}
+            for tag in tags:
+                self.tag_to_ids.setdefault(tag, set()).add(alg_id)
+            self.tag_index.add(alg_id, tags)
+
+    # name: str, name of the algorithm that was removed
+    # Returns: None
+    def discard(self, name: str):
+        """
+        Function: Remove an algorithm after it has been deleted from the database
+        Input: name (str)
+        Outputs: None
+        """
+        with self._lock:
+            if not self._loaded:
+                return
+            alg_id = self.name_to_id.get(name)
+            if alg_id is not None:
+                self._remove_record(alg_id)
+
+    # alg_id: int, database id of the algorithm
+    # Returns: None
+    def _remove_record(self, alg_id: int):
+        """
+        Function: Unlink an algorithm from every index, dropping tags that are no longer used
+        Input: alg_id (int)
+        Outputs: None
+        """
+        record = self.records.pop(alg_id, None)
+        if record is None:
+            return
+        if self.name_to_id.get(record["name"]) == alg_id:
+            del self.name_to_id[record["name"]]
+        self.tag_index.remove(alg_id, record["tags"])
+        for tag in record["tags"]:
+            ids = self.tag_to_ids.get(tag)
+            if ids is None:
+                continue
+            ids.discard(alg_id)
+            # Tags are deleted from the database once their last link goes, so drop them here too
+            if not ids:
+                del self.tag_to_ids[tag]
+                self.tag_ids.pop(tag, None)
@@ -0,0 +1,112 @@
+#   Name: Kayden Ye
+#   Date: 17/10/2026
+#   File: classes/connection_manager.py
+
+import atexit
+import os
+import sqlite3
+import threading
+
+class ConnectionManager:
+    # Each thread keeps one open connection per database file, so connections are reused instead of reopened
+    _local = threading.local()
+    _lock = threading.Lock()
+    _all_connections = []
+
+    # Number of compiled statements kept per connection (sqlite3 default is 128)
+    CACHED_STATEMENTS = 256
+    # Seconds to wait for a lock held by another connection before failing
+    BUSY_TIMEOUT = 5.0
+    # Run once when a connection is opened, not on every query
+    PRAGMAS = (
+        "PRAGMA journal_mode = WAL",  # Readers are not blocked while the writer thread commits
+        "PRAGMA synchronous = NORMAL",  # Safe with WAL and avoids an fsync on every commit
+        "PRAGMA cache_size = -8000",  # 8 MB page cache
+        "PRAGMA temp_store = MEMORY",
+    )
+
+    # db_path: str, path to the SQLite database file (str for opening the file)
+    # Returns: sqlite3.Connection (persistent connection for the calling thread)
+    @classmethod
+    def get_connection(cls, db_path: str) -> sqlite3.Connection:
+        """
+        Function: Get the calling thread's connection to a database, opening it the first time
+        Input: db_path (str)
+        Outputs: sqlite3.Connection that stays open between calls
+        """
+        connections = getattr(cls._local, "connections", None)
+        if connections is None:
+            connections = {}
+            cls._local.connections = connections
+
+        key = os.path.abspath(db_path)
+        conn = connections.get(key)
+        if conn is None:
+            conn = cls._open(db_path)
+            connections[key] = conn
+        return conn
+
+    # db_path: str, path to the SQLite database file (str for opening the file)
+    # Returns: sqlite3.Connection
+    @classmethod
+    def _open(cls, db_path: str) -> sqlite3.Connection:
+        """
+        Function: Open a new connection and apply the connection PRAGMAs
+        Input: db_path (str)
+        Outputs: sqlite3.Connection
+        """
+        # check_same_thread is off only so close_all can close every connection on exit,
+        # each connection is still only used by the thread that opened it
+        conn = sqlite3.connect(
+            db_path,
+            timeout=cls.BUSY_TIMEOUT,
+            cached_statements=cls.CACHED_STATEMENTS,
+            check_same_thread=False,
+        )
+        for pragma in cls.PRAGMAS:
+            try:
+                conn.execute(pragma)
+            except sqlite3.Error:
+                pass
+        with cls._lock:
+            cls._all_connections.append(conn)
+        return conn
+
+    @classmethod
+    def close_thread_connections(cls):
+        """
+        Function: Close the calling thread's connections (used by worker threads before they exit)
+        Input: None
+        Outputs: None
+        """
+        connections = getattr(cls._local, "connections", None)
+        if not connections:
+            return
+        for conn in connections.values():
+            with cls._lock:
+                if conn in cls._all_connections:
+                    cls._all_connections.remove(conn)
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+        connections.clear()
+
+    @classmethod
+    def close_all(cls):
+        """
+        Function: Close every connection opened by any thread
+        Input: None
+        Outputs: None
+        """
+        with cls._lock:
+            connections = cls._all_connections[:]
+            cls._all_connections.clear()
+        for conn in connections:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+        cls._local = threading.local()
+
+atexit.register(ConnectionManager.close_all)
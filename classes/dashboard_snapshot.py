@@ -0,0 +1,88 @@
+#   Name: Kayden Ye
+#   Date: 17/10/2026
+#   File: classes/dashboard_snapshot.py
+
+from types import MappingProxyType
+from typing import NamedTuple
+from .algorithm import Algorithm
+from .tdigest import TDigest
+from .timer_util import TimerUtil
+from .times_store import TimesColumns, TimesStore
+
+class DashboardSnapshot(NamedTuple):
+    # Everything the dashboard cards show for one algorithm, read once and shared by every card.
+    # It is immutable (the columns are read-only arrays) so cards can derive what they need
+    # without changing what the others see
+    name: str
+    # found (bool): False if the algorithm does not exist
+    found: bool
+    notation: str
+    tags: tuple
+    # columns (TimesColumns or None): every solve as NumPy columns, oldest first
+    columns: TimesColumns
+    # stats (mapping): the algorithm_stats values from TimerUtil.get_algorithm_stats, empty if there are no valid times
+    stats: MappingProxyType
+    # sketch (TDigest): distribution of the valid times, for percentiles and the histogram (not changed after loading)
+    sketch: TDigest
+    # weekly (tuple): the weekly rollups from TimerUtil.get_rollups, oldest first, for long-range trends
+    weekly: tuple
+
+    # algorithm_name: str, name of the algorithm to load (str for database lookup)
+    # Returns: DashboardSnapshot
+    # Data Source: cubelab.db, tables: algorithms, times, algorithm_stats, time_sketches, time_rollups
+    @classmethod
+    def load(cls, algorithm_name: str) -> "DashboardSnapshot":
+        """
+        Function: Read an algorithm's details, times and statistics in one go
+        Input: algorithm_name (str)
+        Outputs: DashboardSnapshot
+        """
+        details = Algorithm().get_algorithm_details(algorithm_name)
+        timer_util = TimerUtil()
+        columns = timer_util.get_times_columns(algorithm_name) if details else None
+        if columns is None:
+            return cls(algorithm_name, False, "", (), None, MappingProxyType({}), TDigest(), ())
+
+        notation, tags = details
+        stats = MappingProxyType(timer_util.get_algorithm_stats(algorithm_name))
+        sketch = timer_util.get_sketch(algorithm_name)
+        weekly = tuple(timer_util.get_rollups(algorithm_name, "week"))
+        return cls(algorithm_name, True, notation, tuple(tags), columns, stats, sketch, weekly)
+
+    # Returns: tuple (algorithm_id: int, version: int) or None, changes whenever the algorithm's solves change
+    def data_version(self):
+        if self.columns is None:
+            return None
+        return self.columns.algorithm_id, self.columns.version
+
+    # Returns: numpy array of float64, every result with +2 added and DNFs as DNF (infinity), oldest first
+    def results(self):
+        import numpy as np
+        if self.columns is None:
+            return np.empty(0, dtype=np.float64)
+        return self.columns.results()
+
+    # Returns: numpy array of int64, every solve's timestamp as Unix seconds (UTC), in the same order as results
+    def epochs(self):
+        import numpy as np
+        if self.columns is None:
+            return np.empty(0, dtype=np.int64)
+        return self.columns.epochs
+
+    # limit: int, number of most recent solves
+    # Returns: list of float, results oldest first with +2 added and DNFs as DNF (infinity)
+    def recent_results(self, limit: int) -> list:
+        if self.columns is None:
+            return []
+        return self.columns.results()[-limit:].tolist()
+
+    # Returns: list of (id, time_seconds, epoch, plus_two, dnf), newest first
+    def rows(self) -> list:
+        if self.columns is None:
+            return []
+        ids, times, epochs, penalties = self.columns.ids, self.columns.times, self.columns.epochs, self.columns.penalties
+        return [
+            (int(ids[i]), float(times[i]), int(epochs[i]),
+             bool(penalties[i] & TimesStore.PLUS_TWO), bool(penalties[i] & TimesStore.DNF))
+            for i in range(len(ids) - 1, -1, -1)
+        ]
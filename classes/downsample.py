@@ -0,0 +1,55 @@
+#   Name: Kayden Ye
+#   Date: 17/10/2026
+#   File: classes/downsample.py
+
+import numpy as np
+
+class Downsampler:
+    # Picks which points of a long series to draw, so drawing costs depend on the chart's width in pixels
+    # rather than the number of solves. The full series is never changed, only indices into it are returned
+
+    # x: numpy array, x values in increasing order
+    # y: numpy array, y values (same length as x)
+    # budget: int, largest number of points to keep (e.g. the chart width in pixels)
+    # Returns: numpy array of int64, indices of the points to draw in increasing order
+    @staticmethod
+    def lttb(x, y, budget: int) -> np.ndarray:
+        """
+        Function: Largest-Triangle-Three-Buckets: split the series into buckets and keep the point of each
+                  bucket that makes the biggest triangle with the last kept point and the next bucket's average,
+                  so peaks and dips survive
+        Input: x (array), y (array), budget (int)
+        Outputs: Array of indices, always including the first and last point
+        """
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        count = len(y)
+        if budget >= count or budget < 3:
+            return np.arange(count, dtype=np.int64)
+
+        # Buckets between the first and last point, which are always kept
+        every = (count - 2) / (budget - 2)
+        edges = (np.arange(budget - 1) * every).astype(np.int64) + 1
+        edges[-1] = count - 1
+        sizes = np.diff(edges)
+        x_means = np.add.reduceat(x[1:count - 1], edges[:-1] - 1) / sizes
+        y_means = np.add.reduceat(y[1:count - 1], edges[:-1] - 1) / sizes
+        # The last bucket looks ahead to the last point instead of a bucket average
+        x_means = np.append(x_means[1:], x[-1])
+        y_means = np.append(y_means[1:], y[-1])
+
+        selected = np.empty(budget, dtype=np.int64)
+        selected[0] = 0
+        selected[-1] = count - 1
+        previous = 0
+        for bucket in range(budget - 2):
+            start, end = edges[bucket], edges[bucket + 1]
+            x_previous, y_previous = x[previous], y[previous]
+            # Twice the triangle area, the constant factor does not change which point is largest
+            areas = np.abs(
+                (x_previous - x_means[bucket]) * (y[start:end] - y_previous)
+                - (x_previous - x[start:end]) * (y_means[bucket] - y_previous)
+            )
+            previous = start + int(np.argmax(areas))
+            selected[bucket + 1] = previous
+        return selected
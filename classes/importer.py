@@ -0,0 +1,180 @@
+#   Name: Kayden Ye
+#   Date: 17/10/2026
+#   File: classes/importer.py
+
+import csv
+import json
+import os
+import re
+from .algorithm import Algorithm
+from .catalog import AlgorithmCatalog
+from .connection_manager import ConnectionManager
+
+class AlgorithmImporter:
+    # Rows validated and inserted together with one executemany
+    CHUNK_SIZE = 500
+    # File extension to format
+    FORMATS = {".csv": "csv", ".tsv": "tsv", ".txt": "tsv", ".json": "json", ".jsonl": "jsonl"}
+
+    def __init__(self):
+        self.algorithm = Algorithm()
+        self.db_path = Algorithm.db_path
+
+    # path: str, file to import (str for opening)
+    # file_format: str or None, 'csv', 'tsv', 'json' or 'jsonl', None to use the file extension
+    # on_progress: function or None, called as on_progress(rows_read, imported) after each chunk
+    # Returns: dict (keys: rows, imported, errors), errors is a list of (row_number, message)
+    # Data Source: cubelab.db, tables: algorithms, tags, algorithm_tags
+    def import_file(self, path: str, file_format: str = None, on_progress=None) -> dict:
+        """
+        Function: Import an algorithm set from a file in one transaction
+        Input: path (str), file_format (str or None), on_progress (function or None)
+        Outputs: Dictionary with the number of rows read, the number imported and the rows that were skipped with why
+        """
+        if file_format is None:
+            file_format = self.FORMATS.get(os.path.splitext(path)[1].lower())
+            if file_format is None:
+                raise ValueError(f"Unknown file format for {path}, use csv, tsv, json or jsonl")
+
+        with open(path, newline="", encoding="utf-8-sig") as file:
+            return self.import_rows(self._read_rows(file, file_format), on_progress)
+
+    # rows: iterable of (row_number, name, notation, tags), read lazily from the file
+    # on_progress: function or None, called as on_progress(rows_read, imported) after each chunk
+    # Returns: dict (keys: rows, imported, errors)
+    def import_rows(self, rows, on_progress=None) -> dict:
+        """
+        Function: Validate rows and insert the valid ones in chunks, committing once at the end
+        Input: rows (iterable), on_progress (function or None)
+        Outputs: Dictionary with the number of rows read, the number imported and the rows that were skipped with why
+        """
+        report = {"rows": 0, "imported": 0, "errors": []}
+        catalog = AlgorithmCatalog.get(self.db_path)
+        seen_names = set()
+        chunk = []
+
+        # Load the catalog before the transaction starts, name checks then never go to the database
+        catalog.load()
+        conn = ConnectionManager.get_connection(self.db_path)
+        cursor = conn.cursor()
+        cursor.execute("BEGIN")
+        try:
+            for row_number, name, notation, tags in rows:
+                report["rows"] += 1
+                error = self._validate(name, notation, tags)
+                if error is None and (name in seen_names or catalog.exists(name)):
+                    error = "Name already exists"
+                if error is not None:
+                    report["errors"].append((row_number, error))
+                    continue
+
+                seen_names.add(name)
+                # Same normalisation as the add dialog
+                notation = " ".join(move.upper() for move in notation.split())
+                chunk.append((name, notation, tags))
+                if len(chunk) >= self.CHUNK_SIZE:
+                    report["imported"] += self.algorithm.insert_many(cursor, chunk)
+                    chunk = []
+                    if on_progress:
+                        on_progress(report["rows"], report["imported"])
+
+            report["imported"] += self.algorithm.insert_many(cursor, chunk)
+            conn.commit()
+        except BaseException:
+            # Any failure (even one from a bad row or Ctrl+C) must not leave this thread's connection inside the import
+            conn.rollback()
+            raise
+        finally:
+            # Bulk changes are simpler to reload than to patch in
+            catalog.invalidate()
+
+        if on_progress:
+            on_progress(report["rows"], report["imported"])
+        return report
+
+    # name: str, algorithm name
+    # notation: str, algorithm notation
+    # tags: list of str or None, algorithm tags (None if the file's tags could not be read)
+    # Returns: str or None, why the row is invalid, None if it is valid
+    def _validate(self, name: str, notation: str, tags: list):
+        """
+        Function: Check a row against the same rules as the add algorithm dialog
+        Input: name (str), notation (str), tags (list or None)
+        Outputs: Error message (str) or None
+        """
+        if tags is None:
+            return "Tags must be a list or text"
+        if not name or not notation:
+            return "Name and notation are required"
+        if len(name) > Algorithm.MAX_NAME_LENGTH:
+            return f"Algorithm name must be maximum {Algorithm.MAX_NAME_LENGTH} characters"
+        invalid_moves = Algorithm.find_invalid_moves(notation)
+        if invalid_moves:
+            return f"Invalid moves: {', '.join(invalid_moves)}"
+        if len(tags) > Algorithm.MAX_TAGS:
+            return f"Maximum {Algorithm.MAX_TAGS} tags allowed"
+        for tag in tags:
+            if len(tag) > Algorithm.MAX_TAG_LENGTH:
+                return f"Each tag must be {Algorithm.MAX_TAG_LENGTH} characters or less"
+        return None
+
+    # file: file object, opened in text mode
+    # file_format: str, 'csv', 'tsv', 'json' or 'jsonl'
+    # Returns: generator of (row_number, name, notation, tags)
+    def _read_rows(self, file, file_format: str):
+        """
+        Function: Read rows one at a time so large files are never fully loaded (except plain JSON arrays)
+        Input: file (file object), file_format (str)
+        Outputs: Generator of (row_number, name, notation, tags)
+        """
+        if file_format in ("csv", "tsv"):
+            reader = csv.reader(file, delimiter="," if file_format == "csv" else "\t")
+            columns = ["name", "notation", "tags"]
+            first_row = True
+            for row_number, row in enumerate(reader, start=1):
+                if not row or not any(cell.strip() for cell in row):
+                    continue
+                lowered = [cell.strip().lower() for cell in row]
+                is_header = first_row and "name" in lowered and "notation" in lowered
+                first_row = False
+                if is_header:
+                    # Header row (the first row that is not blank), use it to find the columns
+                    columns = lowered
+                    continue
+                values = dict(zip(columns, row))
+                yield (row_number, values.get("name", "").strip(), values.get("notation", "").strip(),
+                       self._split_tags(values.get("tags", "")))
+        elif file_format == "jsonl":
+            for row_number, line in enumerate(file, start=1):
+                if line.strip():
+                    yield self._json_row(row_number, json.loads(line))
+        elif file_format == "json":
+            data = json.load(file)
+            if isinstance(data, dict):
+                data = data.get("algorithms", [])
+            for row_number, item in enumerate(data, start=1):
+                yield self._json_row(row_number, item)
+        else:
+            raise ValueError(f"Unknown file format {file_format}, use csv, tsv, json or jsonl")
+
+    # row_number: int, position in the file
+    # item: dict, one algorithm from a JSON file
+    # Returns: tuple (row_number, name, notation, tags), tags is None if they are not a list or text
+    def _json_row(self, row_number: int, item: dict) -> tuple:
+        if not isinstance(item, dict):
+            return row_number, "", "", []
+        tags = item.get("tags") or []
+        if isinstance(tags, str):
+            tags = self._split_tags(tags)
+        elif isinstance(tags, list):
+            tags = list(dict.fromkeys(str(tag).strip() for tag in tags if str(tag).strip()))
+        else:
+            tags = None
+        return (row_number, str(item.get("name") or "").strip(),
+                str(item.get("notation") or "").strip(), tags)
+
+    # text: str, tags separated by commas, semicolons or pipes
+    # Returns: list of str, unique tags in order
+    @staticmethod
+    def _split_tags(text: str) -> list:
+        return list(dict.fromkeys(tag.strip() for tag in re.split(r"[,;|]", text or "") if tag.strip()))
@@ -0,0 +1,47 @@
+#   Name: Kayden Ye
+#   Date: 17/10/2026
+#   File: classes/lru_cache.py
+
+import threading
+from collections import OrderedDict
+
+class LRUCache:
+    # A dictionary with a size limit: when it is full, the entry used longest ago is dropped
+
+    # capacity: int, largest number of entries kept
+    # Returns: None
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    # key: hashable, key to look up
+    # Returns: the cached value, or None if it is not cached
+    def get(self, key):
+        with self._lock:
+            if key not in self._entries:
+                return None
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    # key: hashable, key to store under
+    # value: value to cache
+    # Returns: None
+    def put(self, key, value):
+        """
+        Function: Cache a value, dropping the least recently used entries past the capacity
+        Input: key, value
+        Outputs: None
+        """
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.capacity:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
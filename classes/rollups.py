@@ -0,0 +1,64 @@
+#   Name: Kayden Ye
+#   Date: 17/10/2026
+#   File: classes/rollups.py
+
+class Rollups:
+    # SQL for the time_rollups table: daily and weekly aggregates per algorithm, kept current by the
+    # triggers from migration 8 (database.py) and read by TimerUtil.get_rollups
+
+    # Rollup buckets (UTC, like the stored timestamps): each day, and each week starting on Monday
+    PERIODS = {
+        "day": "date({ts})",
+        "week": "date({ts}, 'weekday 0', '-6 days')",
+    }
+    # Length of each bucket, for finding a bucket's times by timestamp range
+    SPANS = {"day": "+1 day", "week": "+7 days"}
+    COLUMNS = "solve_count, dnf_count, time_sum, time_sum_sq, best, worst"
+    _ADJUSTED_TIME = "time_seconds + CASE WHEN COALESCE(plus_two, 0) = 1 THEN 2.0 ELSE 0 END"
+    AGGREGATES = f"""
+        COUNT(*),
+        COALESCE(SUM(COALESCE(dnf, 0) = 1), 0),
+        COALESCE(SUM(CASE WHEN COALESCE(dnf, 0) = 0 THEN {_ADJUSTED_TIME} END), 0),
+        COALESCE(SUM(CASE WHEN COALESCE(dnf, 0) = 0 THEN ({_ADJUSTED_TIME}) * ({_ADJUSTED_TIME}) END), 0),
+        MIN(CASE WHEN COALESCE(dnf, 0) = 0 THEN {_ADJUSTED_TIME} END),
+        MAX(CASE WHEN COALESCE(dnf, 0) = 0 THEN {_ADJUSTED_TIME} END)
+    """
+
+    # period: str, 'day' or 'week'
+    # row: str, 'new' or 'old', the trigger row whose bucket is rebuilt
+    # Returns: str, SQL that recomputes that row's bucket from the times in it (for a trigger body)
+    @staticmethod
+    def rebuild_bucket_sql(period: str, row: str) -> str:
+        bucket = Rollups.PERIODS[period].format(ts=f"{row}.timestamp")
+        return f"""
+            DELETE FROM time_rollups
+            WHERE algorithm_id = {row}.algorithm_id AND period = '{period}' AND bucket = {bucket};
+            INSERT INTO time_rollups (algorithm_id, period, bucket, {Rollups.COLUMNS})
+            SELECT algorithm_id, '{period}', {bucket}, {Rollups.AGGREGATES}
+            FROM times
+            WHERE algorithm_id = {row}.algorithm_id
+              AND timestamp >= {bucket} AND timestamp < date({bucket}, '{Rollups.SPANS[period]}')
+            GROUP BY algorithm_id;
+        """
+
+    # cursor: sqlite3.Cursor, cursor inside the caller's transaction
+    # Returns: None
+    @staticmethod
+    def rebuild(cursor):
+        """
+        Function: Recompute every daily and weekly rollup from the times table
+        Input: cursor
+        Outputs: None
+        """
+        cursor.execute("DELETE FROM time_rollups")
+        for period, bucket in Rollups.PERIODS.items():
+            bucket = bucket.format(ts="timestamp")
+            cursor.execute(
+                f"""
+                INSERT INTO time_rollups (algorithm_id, period, bucket, {Rollups.COLUMNS})
+                SELECT algorithm_id, '{period}', {bucket}, {Rollups.AGGREGATES}
+                FROM times
+                WHERE algorithm_id IN (SELECT id FROM algorithms) AND timestamp IS NOT NULL
+                GROUP BY algorithm_id, {bucket}
+                """
+            )
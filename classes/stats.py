@@ -0,0 +1,123 @@
+#   Name: Kayden Ye
+#   Date: 17/10/2026
+#   File: classes/stats.py
+
+import math
+from bisect import bisect_left, insort
+
+# A DNF result, it sorts after every time so it is always one of the worst solves trimmed off
+DNF = float("inf")
+
+class RollingAverage:
+    # Keeps the last `size` results both in arrival order and in sorted order, so each new solve
+    # costs one binary search to insert and one to remove instead of re-sorting the whole window.
+    # DNFs are pushed as DNF (infinity), kept out of the running total and counted instead
+
+    # size: int, number of solves in the average (int for window size)
+    # trim: int or None, solves dropped from each end, None for the WCA rule in AverageStats.trim_for
+    # Returns: None
+    def __init__(self, size: int, trim: int = None):
+        if size < 1:
+            raise ValueError("Average size must be at least 1")
+        if trim is None:
+            trim = AverageStats.trim_for(size)
+        if trim * 2 >= size:
+            raise ValueError("Cannot trim every solve from the average")
+        self.size = size
+        self.trim = trim
+        self.window = []
+        self.sorted_window = []
+        self.total = 0.0
+        self.dnf_count = 0
+        self.start = 0
+
+    # time: float, newest solve time in seconds, DNF for a DNF
+    # Returns: float or None, the average of the last `size` solves, None until there are enough
+    def push(self, time: float):
+        """
+        Function: Slide the window forward by one solve and return the new average
+        Input: time (float)
+        Outputs: Average (float) or None if fewer than size solves have been pushed
+        """
+        self.window.append(time)
+        insort(self.sorted_window, time)
+        if time == DNF:
+            self.dnf_count += 1
+        else:
+            self.total += time
+
+        if len(self.window) - self.start > self.size:
+            oldest = self.window[self.start]
+            self.start += 1
+            del self.sorted_window[bisect_left(self.sorted_window, oldest)]
+            if oldest == DNF:
+                self.dnf_count -= 1
+            else:
+                self.total -= oldest
+            # Drop consumed times now and then so the list does not grow with the whole history
+            if self.start >= self.size * 4:
+                del self.window[:self.start]
+                self.start = 0
+
+        if len(self.sorted_window) < self.size:
+            return None
+        return self.current()
+
+    # Returns: float or None, the trimmed mean of the current window, DNF if it has too many DNFs
+    def current(self):
+        """
+        Function: Trimmed mean of the solves currently in the window
+        Input: None
+        Outputs: Average (float), DNF if more solves are DNFs than are trimmed, or None if the window is not full
+        """
+        if len(self.sorted_window) < self.size:
+            return None
+        if self.dnf_count > self.trim:
+            return DNF
+        if not self.trim:
+            return self.total / self.size
+        # DNFs are at the top of the sorted window and not in the total, so only the finite trimmed times are taken off
+        finite_worst = self.sorted_window[self.size - self.trim:self.size - self.dnf_count]
+        trimmed = self.total - sum(self.sorted_window[:self.trim]) - sum(finite_worst)
+        return trimmed / (self.size - 2 * self.trim)
+
+class AverageStats:
+    # size: int, number of solves in the average
+    # Returns: int, solves dropped from each end (WCA style: 1 up to ao12, 5% rounded up for bigger averages)
+    @staticmethod
+    def trim_for(size: int) -> int:
+        if size < 3:
+            return 0
+        if size <= 12:
+            return 1
+        return math.ceil(size * 0.05)
+
+    # value: float or None, an average or single
+    # Returns: str, the value to 2 decimals, "DNF" or "N/A"
+    @staticmethod
+    def format_result(value) -> str:
+        if value is None:
+            return "N/A"
+        if value == DNF:
+            return "DNF"
+        return f"{value:.2f}"
+
+    # times: list of float, solve results oldest first, DNF for DNFs (list for ordered values)
+    # size: int, number of solves in the average (e.g. 5 for ao5)
+    # trim: int or None, solves dropped from each end, None for the WCA rule
+    # Returns: tuple (best: float or None, current: float or None)
+    @staticmethod
+    def best_and_current(times: list, size: int, trim: int = None) -> tuple:
+        """
+        Function: Find the best and the most recent aoN in a single pass over the times
+        Input: times (list, oldest first), size (int), trim (int or None)
+        Outputs: Tuple of best average and current average, each None if there are fewer than size times
+        """
+        rolling = RollingAverage(size, trim)
+        best = None
+        average = None
+        for time in times:
+            average = rolling.push(time)
+            if average is not None and (best is None or average < best):
+                best = average
+        return best, average
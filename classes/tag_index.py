@@ -0,0 +1,83 @@
+#   Name: Kayden Ye
+#   Date: 17/10/2026
+#   File: classes/tag_index.py
+
+class TagBitmapIndex:
+    # Each tag maps to a bitset (a Python int) where bit n is set if algorithm id n has the tag,
+    # so combining tags is a handful of big-integer AND/OR operations instead of a join
+    def __init__(self):
+        self.bitmaps = {}
+        self.all_bits = 0
+
+    # alg_id: int, database id of the algorithm (int for the bit position)
+    # tags: list of str, the algorithm's tags
+    # Returns: None
+    def add(self, alg_id: int, tags: list):
+        """
+        Function: Set an algorithm's bit in the bitmap of each of its tags
+        Input: alg_id (int), tags (list)
+        Outputs: None
+        """
+        bit = 1 << alg_id
+        self.all_bits |= bit
+        for tag in tags:
+            self.bitmaps[tag] = self.bitmaps.get(tag, 0) | bit
+
+    # alg_id: int, database id of the algorithm
+    # tags: list of str, the algorithm's tags
+    # Returns: None
+    def remove(self, alg_id: int, tags: list):
+        """
+        Function: Clear an algorithm's bit, dropping tags that no longer have any algorithms
+        Input: alg_id (int), tags (list)
+        Outputs: None
+        """
+        mask = ~(1 << alg_id)
+        self.all_bits &= mask
+        for tag in tags:
+            bits = self.bitmaps.get(tag, 0) & mask
+            if bits:
+                self.bitmaps[tag] = bits
+            else:
+                self.bitmaps.pop(tag, None)
+
+    # include: set of str, tags to filter by
+    # mode: str, 'any' (has at least one tag) or 'all' (has every tag)
+    # exclude: set of str, tags the algorithm must not have
+    # Returns: int, bitset of the matching algorithm ids
+    def query(self, include: set, mode: str = "any", exclude: set = None) -> int:
+        """
+        Function: Combine tag bitmaps with OR ('any') or AND ('all'), then remove excluded tags
+        Input: include (set), mode (str), exclude (set)
+        Outputs: Bitset (int) of matching algorithm ids
+        """
+        if include:
+            if mode == "all":
+                bits = self.all_bits
+                for tag in include:
+                    bits &= self.bitmaps.get(tag, 0)
+                    if not bits:
+                        break
+            else:
+                bits = 0
+                for tag in include:
+                    bits |= self.bitmaps.get(tag, 0)
+        else:
+            bits = self.all_bits
+
+        for tag in exclude or ():
+            bits &= ~self.bitmaps.get(tag, 0)
+        return bits
+
+    # bits: int, bitset of algorithm ids
+    # Returns: list of int, the ids whose bits are set
+    @staticmethod
+    def ids(bits: int) -> list:
+        """
+        Function: Convert a bitset back into algorithm ids
+        Input: bits (int)
+        Outputs: List of ids (int) in ascending order
+        """
+        # Scanning the binary string is much faster in Python than peeling bits off one at a time
+        binary = bin(bits)[:1:-1]
+        return [position for position, digit in enumerate(binary) if digit == "1"]
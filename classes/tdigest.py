@@ -0,0 +1,183 @@
+#   Name: Kayden Ye
+#   Date: 17/10/2026
+#   File: classes/tdigest.py
+
+import json
+import math
+from bisect import bisect_right
+
+class TDigest:
+    # A t-digest: a few hundred weighted centroids that summarise any number of values, kept small
+    # near the median and tiny at the tails, so percentiles stay accurate where they matter
+
+    # Bigger keeps more centroids (more accurate, larger to store)
+    COMPRESSION = 100
+    # Values buffered before they are merged into the centroids
+    BUFFER_SIZE = 200
+
+    # compression: int or None, accuracy setting, None for COMPRESSION
+    # Returns: None
+    def __init__(self, compression: int = None):
+        self.compression = compression or TDigest.COMPRESSION
+        # centroids (list of [mean, weight]): sorted by mean
+        self.centroids = []
+        self.buffer = []
+        self.count = 0
+        self.min = math.inf
+        self.max = -math.inf
+
+    # value: float, value to add
+    # weight: float, how many values it stands for
+    # Returns: None
+    def add(self, value: float, weight: float = 1):
+        self.buffer.append([value, weight])
+        self.count += weight
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        if len(self.buffer) >= TDigest.BUFFER_SIZE:
+            self._compress()
+
+    def _compress(self):
+        """
+        Function: Merge the buffered values into the centroids, combining neighbours while they stay under the size limit
+        Input: None
+        Outputs: None
+        """
+        if not self.buffer:
+            return
+        items = sorted(self.centroids + self.buffer)
+        self.buffer = []
+        total = self.count
+        merged = []
+        mean, weight = items[0]
+        weight_before = 0.0
+        for item_mean, item_weight in items[1:]:
+            combined = weight + item_weight
+            # Centroid size limit 4·n·q·(1−q)/compression, so centroids near the tails stay small
+            q = (weight_before + combined / 2) / total
+            if combined <= max(1.0, 4 * total * q * (1 - q) / self.compression):
+                mean += (item_mean - mean) * item_weight / combined
+                weight = combined
+            else:
+                merged.append([mean, weight])
+                weight_before += weight
+                mean, weight = item_mean, item_weight
+        merged.append([mean, weight])
+        self.centroids = merged
+
+    # q: float, quantile between 0 and 1 (0.5 for the median)
+    # Returns: float or None, estimated value at that quantile, None if the digest is empty
+    def quantile(self, q: float):
+        """
+        Function: Estimate a percentile by interpolating between centroid centres
+        Input: q (float)
+        Outputs: Estimated value (float) or None
+        """
+        self._compress()
+        if not self.centroids:
+            return None
+        if len(self.centroids) == 1:
+            return self.centroids[0][0]
+        target = min(max(q, 0.0), 1.0) * self.count
+
+        first_mean, first_weight = self.centroids[0]
+        if target <= first_weight / 2:
+            return self.min + (first_mean - self.min) * target / (first_weight / 2)
+
+        position = 0.0
+        for (mean, weight), (next_mean, next_weight) in zip(self.centroids, self.centroids[1:]):
+            centre = position + weight / 2
+            next_centre = position + weight + next_weight / 2
+            if target <= next_centre:
+                return mean + (next_mean - mean) * (target - centre) / (next_centre - centre)
+            position += weight
+
+        last_mean, last_weight = self.centroids[-1]
+        last_centre = self.count - last_weight / 2
+        return last_mean + (self.max - last_mean) * (target - last_centre) / (last_weight / 2)
+
+    # value: float, value to look up
+    # Returns: float, estimated fraction of values at or below it
+    def cdf(self, value: float) -> float:
+        """
+        Function: Estimate the fraction of values at or below a value (the inverse of quantile)
+        Input: value (float)
+        Outputs: Fraction between 0 and 1
+        """
+        self._compress()
+        if not self.centroids or value < self.min:
+            return 0.0
+        if value >= self.max:
+            return 1.0
+
+        first_mean, first_weight = self.centroids[0]
+        if value <= first_mean:
+            span = first_mean - self.min
+            return (first_weight / 2) * ((value - self.min) / span if span else 1.0) / self.count
+
+        position = 0.0
+        for (mean, weight), (next_mean, next_weight) in zip(self.centroids, self.centroids[1:]):
+            centre = position + weight / 2
+            next_centre = position + weight + next_weight / 2
+            if value <= next_mean:
+                span = next_mean - mean
+                return (centre + (next_centre - centre) * ((value - mean) / span if span else 1.0)) / self.count
+            position += weight
+
+        last_mean, last_weight = self.centroids[-1]
+        last_centre = self.count - last_weight / 2
+        span = self.max - last_mean
+        return (last_centre + (last_weight / 2) * ((value - last_mean) / span if span else 1.0)) / self.count
+
+    # bins: int, number of equal-width bins between the smallest and largest value
+    # Returns: tuple (counts: list of float, edges: list of float), like numpy.histogram
+    def histogram(self, bins: int = 10) -> tuple:
+        """
+        Function: Approximate histogram from the digest, without reading the values
+        Input: bins (int)
+        Outputs: Tuple of estimated counts per bin and the bin edges
+        """
+        if not self.count:
+            return [], []
+        self._compress()
+        width = (self.max - self.min) / bins
+        if width == 0:
+            # Every value is the same, put them all in one bin like numpy does around a single value
+            edges = [self.min - 0.5 + index / bins for index in range(bins + 1)]
+            counts = [0.0] * bins
+            counts[bins // 2] = float(self.count)
+            return counts, edges
+        edges = [self.min + width * index for index in range(bins)] + [self.max]
+        if all(weight == 1 for _, weight in self.centroids):
+            # Small digests still hold every value, so count them exactly (the last bin includes the largest value)
+            counts = [0.0] * bins
+            for mean, _ in self.centroids:
+                counts[min(bins - 1, bisect_right(edges, mean) - 1)] += 1
+            return counts, edges
+        fractions = [0.0] + [self.cdf(edge) for edge in edges[1:-1]] + [1.0]
+        counts = [(high - low) * self.count for low, high in zip(fractions, fractions[1:])]
+        return counts, edges
+
+    # Returns: str, JSON for storing the digest
+    def to_json(self) -> str:
+        self._compress()
+        return json.dumps({
+            "compression": self.compression,
+            "count": self.count,
+            "min": self.min,
+            "max": self.max,
+            "centroids": self.centroids,
+        })
+
+    # text: str, JSON from to_json
+    # Returns: TDigest
+    @classmethod
+    def from_json(cls, text: str) -> "TDigest":
+        data = json.loads(text)
+        digest = cls(data["compression"])
+        digest.count = data["count"]
+        digest.centroids = data["centroids"]
+        if digest.count:
+            digest.min = data["min"]
+            digest.max = data["max"]
+        return digest
@@ -5,8 +5,18 @@
 import sqlite3
 import time
 from .algorithm import Algorithm
+from .catalog import AlgorithmCatalog
+from .rollups import Rollups
+from .connection_manager import ConnectionManager
+from .stats import AverageStats, DNF
+from .tdigest import TDigest
+from .times_store import TimesStore
+from .write_queue import WriteQueue
 
 class TimerUtil:
+    # Average sizes whose PBs are cached in algorithm_stats (column aoN_pb for each N)
+    CACHED_AVERAGES = (5, 12, 50, 100)
+
     def __init__(self):
         self.db_path = Algorithm.db_path
 
@@ -20,23 +30,157 @@ class TimerUtil:
         Outputs: True on success, false otherwise
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with ConnectionManager.get_connection(self.db_path) as conn:
                 cursor = conn.cursor()
-                # Get algorithm ID
-                cursor.execute("SELECT id FROM algorithms WHERE name = ?", (algorithm_name,))
-                result = cursor.fetchone()
-                if result:
-                    algorithm_id = result[0]
-                    # Insert the time
-                    cursor.execute(
-                        "INSERT INTO times (algorithm_id, time_seconds, plus_two, dnf) VALUES (?, ?, 0, 0)",
-                        (algorithm_id, time_seconds)
-                    )
+                inserted = self._insert_time(cursor, algorithm_name, time_seconds)
+                if inserted:
                     conn.commit()
+                    self._store_inserted(inserted)
                     return True
                 return False
         except Exception:
             return False
+
+    # algorithm_name: str, name of the algorithm (str for database lookup)
+    # time_seconds: float, time to save (float for precision to three decimals)
+    # callback: function or None, called with True/False once the time is committed (function for UI feedback)
+    # Returns: None
+    def save_time_async(self, algorithm_name, time_seconds, callback=None):
+        """
+        Function: Queue a stopwatch time to be saved by the background writer
+        Input: algorithm_name, time_seconds, callback
+        Outputs: None (callback receives True on success, false otherwise)
+        """
+        WriteQueue.get(self.db_path).submit(
+            self._insert_time, algorithm_name, time_seconds,
+            callback=self._wrap_callback(callback),
+            on_commit=self._store_inserted
+        )
+
+    # cursor: sqlite3.Cursor, cursor inside the caller's transaction
+    # algorithm_name: str, name of the algorithm (str for database lookup)
+    # time_seconds: float, time to save
+    # Returns: tuple (algorithm_id, time_id, time_seconds, epoch) if inserted, None if the algorithm does not exist
+    @staticmethod
+    def _insert_time(cursor, algorithm_name, time_seconds):
+        """
+        Function: Insert a time without committing
+        Input: cursor, algorithm_name, time_seconds
+        Outputs: The new time's ids and Unix timestamp if inserted, None if the algorithm does not exist
+        """
+        # Get algorithm ID
+        cursor.execute("SELECT id FROM algorithms WHERE name = ?", (algorithm_name,))
+        result = cursor.fetchone()
+        if not result:
+            return None
+        algorithm_id = result[0]
+        # Insert the time
+        cursor.execute(
+            "INSERT INTO times (algorithm_id, time_seconds, plus_two, dnf) VALUES (?, ?, 0, 0)",
+            (algorithm_id, time_seconds)
+        )
+        time_id = cursor.lastrowid
+        cursor.execute("SELECT CAST(strftime('%s', timestamp) AS INTEGER) FROM times WHERE id = ?", (time_id,))
+        epoch = cursor.fetchone()[0]
+        TimerUtil._update_cached_averages(cursor, algorithm_id)
+        TimerUtil._update_sketch(cursor, algorithm_id, time_seconds)
+        return algorithm_id, time_id, time_seconds, epoch
+
+    # cursor: sqlite3.Cursor, cursor inside the transaction that just inserted a time
+    # algorithm_id: int, algorithm the time was added to
+    # time_seconds: float, the new time (new times have no penalty)
+    # Returns: None
+    @staticmethod
+    def _update_sketch(cursor, algorithm_id, time_seconds):
+        """
+        Function: Add a new time to the algorithm's stored t-digest, if it has been built
+        Input: cursor, algorithm_id, time_seconds
+        Outputs: None
+        """
+        cursor.execute("SELECT digest FROM time_sketches WHERE algorithm_id = ?", (algorithm_id,))
+        row = cursor.fetchone()
+        if row is None or row[0] is None:
+            # Not built yet or waiting to be rebuilt, the next read builds it from every time
+            return
+        digest = TDigest.from_json(row[0])
+        digest.add(time_seconds)
+        cursor.execute("UPDATE time_sketches SET digest = ? WHERE algorithm_id = ?", (digest.to_json(), algorithm_id))
+
+    # inserted: tuple (algorithm_id, time_id, time_seconds, epoch) or None, from _insert_time
+    # Returns: None
+    def _store_inserted(self, inserted):
+        if inserted:
+            TimesStore.get(self.db_path).append(*inserted)
+
+    # cursor: sqlite3.Cursor, cursor inside the transaction that just inserted a time
+    # algorithm_id: int, algorithm the time was added to
+    # Returns: None
+    @staticmethod
+    def _update_cached_averages(cursor, algorithm_id):
+        """
+        Function: Lower the cached ao PBs if the newest averages beat them (only the newest windows can be new PBs)
+        Input: cursor, algorithm_id
+        Outputs: None
+        """
+        cursor.execute("SELECT averages_stale FROM algorithm_stats WHERE algorithm_id = ?", (algorithm_id,))
+        row = cursor.fetchone()
+        if row is None or row[0]:
+            # Stale PBs are recomputed from every time when they are next read
+            return
+        recent = TimerUtil._recent_results(cursor, algorithm_id, max(TimerUtil.CACHED_AVERAGES))
+        updates = []
+        params = []
+        for size in TimerUtil.CACHED_AVERAGES:
+            _, current = AverageStats.best_and_current(recent[-size:], size)
+            if current is not None:
+                updates.append(f"ao{size}_pb = MIN(COALESCE(ao{size}_pb, ?), ?)")
+                params.extend([current, current])
+        if updates:
+            params.append(algorithm_id)
+            cursor.execute(f"UPDATE algorithm_stats SET {', '.join(updates)} WHERE algorithm_id = ?", params)
+
+    # cursor: sqlite3.Cursor
+    # algorithm_id: int, algorithm to read
+    # limit: int or None, number of most recent solves, None for all of them
+    # Returns: list of float, results oldest first with +2 added and DNFs as DNF (infinity)
+    @staticmethod
+    def _recent_results(cursor, algorithm_id, limit=None):
+        cursor.execute(
+            """
+            SELECT time_seconds + CASE WHEN COALESCE(plus_two, 0) = 1 THEN 2.0 ELSE 0 END, COALESCE(dnf, 0)
+            FROM times
+            WHERE algorithm_id = ?
+            ORDER BY timestamp DESC, id DESC
+            LIMIT ?
+            """,
+            (algorithm_id, -1 if limit is None else limit)
+        )
+        return [DNF if dnf else time for time, dnf in reversed(cursor.fetchall())]
+
+    # callback: function or None, takes a single bool
+    # Returns: function or None, in the (success, result) form the write queue calls
+    @staticmethod
+    def _wrap_callback(callback):
+        if callback is None:
+            return None
+        return lambda success, result: callback(bool(success and result))
+
+    def flush_writes(self):
+        """
+        Function: Wait for queued writes to be committed so reads see them
+        Input: None
+        Outputs: None
+        """
+        WriteQueue.get(self.db_path).flush()
+
+    # Returns: int, number of callbacks run
+    def dispatch_write_results(self):
+        """
+        Function: Run callbacks for writes the background writer has finished (call from the UI thread)
+        Input: None
+        Outputs: Number of callbacks run
+        """
+        return WriteQueue.get(self.db_path).dispatch_callbacks()
     
     # algorithm_name: str, name of the algorithm (str for database lookup)
     # Returns: list of (adjusted_time_seconds, timestamp)
@@ -47,7 +191,7 @@ class TimerUtil:
         Outputs: List of adjusted_time_seconds, timestamp
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with ConnectionManager.get_connection(self.db_path) as conn:
                 cursor = conn.cursor()
                 
                 cursor.execute("""
@@ -60,13 +204,30 @@ class TimerUtil:
                     FROM times t
                     JOIN algorithms a ON t.algorithm_id = a.id
                     WHERE a.name = ? AND COALESCE(t.dnf, 0) = 0
-                    ORDER BY t.timestamp DESC
+                    ORDER BY t.timestamp DESC, t.id DESC
                 """, (algorithm_name,))
                 return cursor.fetchall()
         except Exception as e:
             print(f"Error getting algorithm times: {e}")
             return []
     
+    # algorithm_name: str, name of the algorithm (str for database lookup)
+    # Returns: TimesColumns or None, the algorithm's solves as NumPy columns oldest first, None if it does not exist
+    def get_times_columns(self, algorithm_name):
+        """
+        Function: Get an algorithm's solves from the in-memory columnar store
+        Input: algorithm_name
+        Outputs: TimesColumns (ids, times, epochs, penalties, algorithm_id, version) or None
+        """
+        algorithm_id = AlgorithmCatalog.get(self.db_path).get_id(algorithm_name)
+        if algorithm_id is None:
+            return None
+        try:
+            return TimesStore.get(self.db_path).get_columns(algorithm_id)
+        except Exception as e:
+            print(f"Error getting times columns: {e}")
+            return None
+
     # algorithm_name: str, name of the algorithm (str for database lookup)
     # Returns: int (number of times recorded for a particular algorithm)
     def get_time_count(self, algorithm_name):
@@ -76,17 +237,213 @@ class TimerUtil:
         Outputs: Count for times for algorithm_name
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with ConnectionManager.get_connection(self.db_path) as conn:
                 cursor = conn.cursor()
                 cursor.execute("""
-                    SELECT COUNT(*) FROM times t
-                    JOIN algorithms a ON t.algorithm_id = a.id
+                    SELECT COALESCE(s.solve_count, 0) FROM algorithms a
+                    LEFT JOIN algorithm_stats s ON s.algorithm_id = a.id
                     WHERE a.name = ?
                 """, (algorithm_name,))
-                return cursor.fetchone()[0]
+                row = cursor.fetchone()
+                return row[0] if row else 0
         except Exception:
             return 0
     
+    # algorithm_name: str, name of the algorithm (str for database lookup)
+    # Returns: dict (keys: count, valid_count, dnf_count, best, worst, average, last_timestamp, aoN_pb for each
+    #          CACHED_AVERAGES size, median, p90) or empty dictionary if the algorithm has no valid times
+    # Data Source: cubelab.db, tables: algorithm_stats, time_sketches
+    def get_algorithm_stats(self, algorithm_name):
+        """
+        Function: Read an algorithm's statistics from its algorithm_stats row, recomputing the cached ao PBs if they are stale
+        Input: algorithm_name
+        Outputs: Dictionary of statistics or empty dictionary
+        """
+        try:
+            conn = ConnectionManager.get_connection(self.db_path)
+            cursor = conn.cursor()
+            cursor.execute(
+                f"""
+                SELECT s.algorithm_id, s.solve_count, s.valid_count, s.dnf_count, s.time_sum, s.best, s.worst,
+                       s.last_timestamp, s.averages_stale, s.version,
+                       {', '.join(f's.ao{size}_pb' for size in self.CACHED_AVERAGES)}
+                FROM algorithm_stats s
+                JOIN algorithms a ON a.id = s.algorithm_id
+                WHERE a.name = ?
+                """,
+                (algorithm_name,)
+            )
+            row = cursor.fetchone()
+            if row is None or row[2] == 0:
+                return {}
+            algorithm_id, count, valid_count, dnf_count, time_sum, best, worst, last_timestamp, stale, version = row[:10]
+            pbs = dict(zip(self.CACHED_AVERAGES, row[10:]))
+            if stale:
+                pbs = self._refresh_cached_averages(conn, algorithm_id, version, count)
+
+            stats = {
+                'count': count,
+                'valid_count': valid_count,
+                'dnf_count': dnf_count,
+                'best': best,
+                'worst': worst,
+                'average': time_sum / valid_count,
+                'last_timestamp': last_timestamp,
+            }
+            for size, pb in pbs.items():
+                stats[f'ao{size}_pb'] = pb
+            # Percentiles of the valid times, estimated from the stored t-digest
+            sketch = self._load_sketch(algorithm_id)
+            stats['median'] = sketch.quantile(0.5)
+            stats['p90'] = sketch.quantile(0.9)
+            return stats
+        except Exception as e:
+            print(f"Error getting algorithm stats: {e}")
+            return {}
+
+    # Returns: None
+    # Data Source: cubelab.db, table: algorithm_stats
+    def refresh_stale_averages(self):
+        """
+        Function: Recompute the cached ao PBs of every algorithm whose times changed since they were last computed
+        Input: None
+        Outputs: None
+        """
+        try:
+            conn = ConnectionManager.get_connection(self.db_path)
+            cursor = conn.cursor()
+            # Rows without valid times have no PBs to recompute
+            cursor.execute(
+                "SELECT algorithm_id, version, solve_count FROM algorithm_stats WHERE averages_stale = 1 AND valid_count > 0"
+            )
+            for algorithm_id, version, solve_count in cursor.fetchall():
+                self._refresh_cached_averages(conn, algorithm_id, version, solve_count)
+        except Exception as e:
+            print(f"Error refreshing cached averages: {e}")
+
+    # conn: sqlite3.Connection, the calling thread's connection
+    # algorithm_id: int, algorithm whose cached PBs are stale
+    # version: int, algorithm_stats version the stale row was read at
+    # solve_count: int, algorithm_stats solve count the stale row was read at
+    # Returns: dict of int to float or None, the recomputed PB for each cached average size
+    def _refresh_cached_averages(self, conn, algorithm_id, version, solve_count):
+        """
+        Function: Recompute the cached ao PBs from every time and save them if the row has not changed since it was read
+        Input: conn, algorithm_id, version, solve_count
+        Outputs: Dictionary of average size to PB
+        """
+        # NumPy is only needed here, not on the timer's save path
+        from .averages import AveragesEngine
+
+        cursor = conn.cursor()
+        results = TimesStore.get(self.db_path).get_columns(algorithm_id).results()
+        if len(results) != solve_count:
+            # The store is patched just after a commit, read the times themselves if it has not caught up yet
+            results = AveragesEngine.results_from_rows(self._rows_with_ids(cursor, "t.algorithm_id = ?", algorithm_id))
+        pbs = {size: best for size, (best, _) in AveragesEngine.summary(results, self.CACHED_AVERAGES).items()}
+        with conn:
+            # If a time was added or changed meanwhile, leave the row stale for the next read
+            cursor.execute(
+                f"""
+                UPDATE algorithm_stats SET {', '.join(f'ao{size}_pb = ?' for size in pbs)}, averages_stale = 0
+                WHERE algorithm_id = ? AND version = ?
+                """,
+                [*pbs.values(), algorithm_id, version]
+            )
+        return pbs
+
+    # algorithm_name: str, name of the algorithm (str for database lookup)
+    # Returns: TDigest, sketch of the algorithm's valid times (empty if it has none)
+    # Data Source: cubelab.db, table: time_sketches
+    def get_sketch(self, algorithm_name):
+        """
+        Function: Get the t-digest of an algorithm's times for percentiles and approximate histograms
+        Input: algorithm_name
+        Outputs: TDigest
+        """
+        algorithm_id = AlgorithmCatalog.get(self.db_path).get_id(algorithm_name)
+        if algorithm_id is None:
+            return TDigest()
+        try:
+            return self._load_sketch(algorithm_id)
+        except sqlite3.Error as e:
+            print(f"Error getting sketch: {e}")
+            return TDigest()
+
+    # algorithm_id: int, algorithm to read
+    # Returns: TDigest
+    def _load_sketch(self, algorithm_id):
+        """
+        Function: Read a stored t-digest, building and saving it from the times if it is missing or stale
+        Input: algorithm_id
+        Outputs: TDigest
+        """
+        conn = ConnectionManager.get_connection(self.db_path)
+        cursor = conn.cursor()
+        cursor.execute("SELECT digest FROM time_sketches WHERE algorithm_id = ?", (algorithm_id,))
+        row = cursor.fetchone()
+        if row is not None and row[0] is not None:
+            return TDigest.from_json(row[0])
+
+        # algorithm_stats.version changes with every write to the algorithm's times
+        cursor.execute("SELECT version FROM algorithm_stats WHERE algorithm_id = ?", (algorithm_id,))
+        version = cursor.fetchone()
+        digest = TDigest()
+        for result in self._recent_results(cursor, algorithm_id):
+            if result != DNF:
+                digest.add(result)
+        if version is not None:
+            with conn:
+                # Only saved if no time was written meanwhile, otherwise the next read builds it again
+                cursor.execute(
+                    """
+                    INSERT OR REPLACE INTO time_sketches (algorithm_id, digest)
+                    SELECT ?, ? WHERE (SELECT version FROM algorithm_stats WHERE algorithm_id = ?) = ?
+                    """,
+                    (algorithm_id, digest.to_json(), algorithm_id, version[0])
+                )
+        return digest
+
+    # algorithm_name: str, name of the algorithm (str for database lookup)
+    # period: str, 'day' or 'week' (str for the rollup bucket size)
+    # since: str or None, first bucket to include as 'YYYY-MM-DD', None for the whole history
+    # Returns: list of (bucket, solve_count, dnf_count, mean, std_dev, best, worst), oldest first,
+    #          mean, std_dev, best and worst are None for buckets with only DNFs
+    # Data Source: cubelab.db, table: time_rollups
+    def get_rollups(self, algorithm_name, period="day", since=None):
+        """
+        Function: Get daily or weekly aggregates for an algorithm, one row per bucket instead of one per solve
+        Input: algorithm_name, period, since
+        Outputs: List of bucket statistics, oldest first
+        """
+        if period not in Rollups.PERIODS:
+            raise ValueError(f"Unknown rollup period {period}, use 'day' or 'week'")
+        try:
+            cursor = ConnectionManager.get_connection(self.db_path).cursor()
+            cursor.execute(
+                """
+                SELECT r.bucket, r.solve_count, r.dnf_count, r.time_sum, r.time_sum_sq, r.best, r.worst
+                FROM time_rollups r
+                JOIN algorithms a ON a.id = r.algorithm_id
+                WHERE a.name = ? AND r.period = ? AND r.bucket >= ?
+                ORDER BY r.bucket
+                """,
+                (algorithm_name, period, since or "")
+            )
+            rollups = []
+            for bucket, count, dnf_count, time_sum, time_sum_sq, best, worst in cursor.fetchall():
+                valid_count = count - dnf_count
+                mean = std_dev = None
+                if valid_count:
+                    mean = time_sum / valid_count
+                    # Population standard deviation from the running sums, clamped against rounding below zero
+                    std_dev = max(time_sum_sq / valid_count - mean * mean, 0.0) ** 0.5
+                rollups.append((bucket, count, dnf_count, mean, std_dev, best, worst))
+            return rollups
+        except sqlite3.Error as e:
+            print(f"Error getting rollups: {e}")
+            return []
+
     # times_data: list, list of (time_seconds, timestamp) tuples (list for stats)
     # Returns: dict (keys: best, worst, average, count)
     def get_time_statistics(self, times_data):
@@ -115,22 +472,28 @@ class TimerUtil:
         Outputs: id, time_seconds, timestamp, plus_two, dnf
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                
-                cursor.execute("""
-                    SELECT t.id, t.time_seconds, t.timestamp, 
-                           COALESCE(t.plus_two, 0), COALESCE(t.dnf, 0)
-                    FROM times t
-                    JOIN algorithms a ON t.algorithm_id = a.id
-                    WHERE a.name = ?
-                    ORDER BY t.timestamp DESC
-                """, (algorithm_name,))
-                return cursor.fetchall()
+            with ConnectionManager.get_connection(self.db_path) as conn:
+                return self._rows_with_ids(conn.cursor(), "a.name = ?", algorithm_name)
         except Exception as e:
             print(f"Error getting times with IDs: {e}")
             return []
 
+    # cursor: sqlite3.Cursor
+    # condition: str, WHERE clause picking the algorithm (t is times, a is algorithms)
+    # value: str or int, the condition's parameter
+    # Returns: list of (id, time_seconds, timestamp, plus_two, dnf), newest first
+    @staticmethod
+    def _rows_with_ids(cursor, condition, value):
+        cursor.execute(f"""
+            SELECT t.id, t.time_seconds, t.timestamp, 
+                   COALESCE(t.plus_two, 0), COALESCE(t.dnf, 0)
+            FROM times t
+            JOIN algorithms a ON t.algorithm_id = a.id
+            WHERE {condition}
+            ORDER BY t.timestamp DESC, t.id DESC
+        """, (value,))
+        return cursor.fetchall()
+
     # time_id: int, unique ID of the time entry (int for database key)
     # plus_two: bool or None, set +2 penalty (bool for database update)
     # dnf: bool or None, set DNF status (bool for database update)
@@ -142,30 +505,64 @@ class TimerUtil:
         Outputs: True if time was updated, false otherwise
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with ConnectionManager.get_connection(self.db_path) as conn:
                 cursor = conn.cursor()
-
-                updates = []
-                params = []
-
-                if plus_two is not None:
-                    updates.append("plus_two = ?")
-                    params.append(plus_two)
-                
-                if dnf is not None:
-                    updates.append("dnf = ?")
-                    params.append(dnf)
-                
-                if updates:
-                    params.append(time_id)
-                    query = f"UPDATE times SET {', '.join(updates)} WHERE id = ?"
-                    cursor.execute(query, params)
+                if self._apply_penalty(cursor, time_id, plus_two, dnf):
                     conn.commit()
-                    return cursor.rowcount > 0
+                    TimesStore.get(self.db_path).patch(time_id, plus_two, dnf)
+                    return True
                 return False
         except Exception as e:
             print(f"Error updating time penalty: {e}")
             return False
+
+    # time_id: int, unique ID of the time entry (int for database key)
+    # plus_two: bool or None, set +2 penalty (bool for database update)
+    # dnf: bool or None, set DNF status (bool for database update)
+    # callback: function or None, called with True/False once the update is committed (function for UI refresh)
+    # Returns: None
+    def update_time_penalty_async(self, time_id, plus_two=None, dnf=None, callback=None):
+        """
+        Function: Queue a penalty update to be saved by the background writer
+        Input: time_id, plus_two, dnf, callback
+        Outputs: None (callback receives True if the time was updated, false otherwise)
+        """
+        store = TimesStore.get(self.db_path)
+        WriteQueue.get(self.db_path).submit(
+            self._apply_penalty, time_id, plus_two, dnf,
+            callback=self._wrap_callback(callback),
+            on_commit=lambda updated: updated and store.patch(time_id, plus_two, dnf)
+        )
+
+    # cursor: sqlite3.Cursor, cursor inside the caller's transaction
+    # time_id: int, unique ID of the time entry
+    # plus_two: bool or None, set +2 penalty
+    # dnf: bool or None, set DNF status
+    # Returns: bool (True if a row was updated)
+    @staticmethod
+    def _apply_penalty(cursor, time_id, plus_two, dnf):
+        """
+        Function: Update penalties for a time without committing
+        Input: cursor, time_id, plus_two, dnf
+        Outputs: True if the time was updated, false otherwise
+        """
+        updates = []
+        params = []
+
+        if plus_two is not None:
+            updates.append("plus_two = ?")
+            params.append(plus_two)
+        
+        if dnf is not None:
+            updates.append("dnf = ?")
+            params.append(dnf)
+        
+        if not updates:
+            return False
+        params.append(time_id)
+        query = f"UPDATE times SET {', '.join(updates)} WHERE id = ?"
+        cursor.execute(query, params)
+        return cursor.rowcount > 0
     
     # time_id: int, unique ID of the time entry (int for database key)
     # Returns: bool (True if deleted, false otherwise)
@@ -176,11 +573,14 @@ class TimerUtil:
         Outputs: True if time was deleted, false otherwise
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with ConnectionManager.get_connection(self.db_path) as conn:
                 cursor = conn.cursor()
                 cursor.execute("DELETE FROM times WHERE id = ?", (time_id,))
                 conn.commit()
-                return cursor.rowcount > 0
+                if cursor.rowcount > 0:
+                    TimesStore.get(self.db_path).remove(time_id)
+                    return True
+                return False
         except Exception as e:
             print(f"Error deleting time: {e}")
             return False
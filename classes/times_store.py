@@ -0,0 +1,227 @@
+#   Name: Kayden Ye
+#   Date: 17/10/2026
+#   File: classes/times_store.py
+
+import os
+import threading
+from typing import NamedTuple
+from .connection_manager import ConnectionManager
+
+# NumPy is imported inside the methods that build arrays, so the timer's save path (which only patches
+# algorithms that are already loaded) never pays for importing it
+
+class TimesColumns(NamedTuple):
+    # One algorithm's solves as columns, oldest first (read-only copies)
+    ids: object  # numpy int64, times.id
+    times: object  # numpy float64, time_seconds without penalties
+    epochs: object  # numpy int64, timestamp as Unix seconds (UTC)
+    penalties: object  # numpy uint8, TimesStore.PLUS_TWO and TimesStore.DNF bits
+    algorithm_id: int
+    # version (int): changes whenever the algorithm's solves change, never reused within a run
+    version: int
+
+    # Returns: numpy array of float64, results with +2 added and DNFs as infinity
+    def results(self):
+        import numpy as np
+        results = self.times + 2.0 * ((self.penalties & TimesStore.PLUS_TWO) != 0)
+        results[(self.penalties & TimesStore.DNF) != 0] = np.inf
+        return results
+
+    # Returns: numpy array of bool, True for solves that are not DNFs
+    def valid(self):
+        return (self.penalties & TimesStore.DNF) == 0
+
+class _Columns:
+    # Growable arrays for one algorithm, doubled when full so appends are amortised O(1)
+    def __init__(self, ids, times, epochs, penalties):
+        self.ids = ids
+        self.times = times
+        self.epochs = epochs
+        self.penalties = penalties
+        self.length = len(ids)
+        # version (int): set by TimesStore each time these columns change
+        self.version = 0
+
+    def append(self, time_id: int, time_seconds: float, epoch: int, penalty: int):
+        import numpy as np
+        if self.length == len(self.ids):
+            capacity = max(16, self.length * 2)
+            for name in ("ids", "times", "epochs", "penalties"):
+                old = getattr(self, name)
+                grown = np.empty(capacity, dtype=old.dtype)
+                grown[:self.length] = old[:self.length]
+                setattr(self, name, grown)
+        index = self.length
+        self.ids[index] = time_id
+        self.times[index] = time_seconds
+        self.epochs[index] = epoch
+        self.penalties[index] = penalty
+        self.length += 1
+
+    # time_id: int
+    # Returns: int or None, position of the time in the columns
+    def find(self, time_id: int):
+        import numpy as np
+        matches = np.flatnonzero(self.ids[:self.length] == time_id)
+        return int(matches[0]) if len(matches) else None
+
+    def remove(self, index: int):
+        for name in ("ids", "times", "epochs", "penalties"):
+            column = getattr(self, name)
+            column[index:self.length - 1] = column[index + 1:self.length]
+        self.length -= 1
+
+    # algorithm_id: int, algorithm these columns belong to
+    # Returns: TimesColumns
+    def snapshot(self, algorithm_id: int) -> TimesColumns:
+        columns = []
+        for name in ("ids", "times", "epochs", "penalties"):
+            column = getattr(self, name)[:self.length].copy()
+            column.flags.writeable = False
+            columns.append(column)
+        return TimesColumns(*columns, algorithm_id, self.version)
+
+class TimesStore:
+    # Penalty bits
+    PLUS_TWO = 1
+    DNF = 2
+
+    # One store per database file
+    _instances = {}
+    _instances_lock = threading.Lock()
+
+    # db_path: str, path to the SQLite database file (str for loading)
+    # Returns: TimesStore (shared store for that database)
+    @classmethod
+    def get(cls, db_path: str) -> "TimesStore":
+        """
+        Function: Get the shared times store for a database
+        Input: db_path (str)
+        Outputs: TimesStore
+        """
+        key = os.path.abspath(db_path)
+        with cls._instances_lock:
+            instance = cls._instances.get(key)
+            if instance is None:
+                instance = cls(db_path)
+                cls._instances[key] = instance
+            return instance
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        # columns (dict of int to _Columns): algorithm id to its solves, only for algorithms that were read
+        self._columns = {}
+        # Last version given out, each load or change takes the next one so versions are never reused
+        self._version = 0
+
+    # columns: _Columns, columns that were just loaded or changed (call with the lock held)
+    # Returns: None
+    def _bump_version(self, columns: _Columns):
+        self._version += 1
+        columns.version = self._version
+
+    # algorithm_id: int, algorithm to read
+    # Returns: TimesColumns, the algorithm's solves oldest first
+    # Data Source: cubelab.db, table: times
+    def get_columns(self, algorithm_id: int) -> TimesColumns:
+        """
+        Function: Get an algorithm's solves as columns, loading them with one query the first time
+        Input: algorithm_id (int)
+        Outputs: TimesColumns
+        """
+        with self._lock:
+            columns = self._columns.get(algorithm_id)
+            if columns is None:
+                columns = self._load(algorithm_id)
+                self._bump_version(columns)
+                self._columns[algorithm_id] = columns
+            return columns.snapshot(algorithm_id)
+
+    # algorithm_id: int
+    # Returns: _Columns
+    def _load(self, algorithm_id: int) -> _Columns:
+        import numpy as np
+        cursor = ConnectionManager.get_connection(self.db_path).cursor()
+        cursor.execute(
+            """
+            SELECT id, time_seconds, CAST(strftime('%s', timestamp) AS INTEGER),
+                   (COALESCE(plus_two, 0) != 0) | ((COALESCE(dnf, 0) != 0) << 1)
+            FROM times
+            WHERE algorithm_id = ?
+            ORDER BY timestamp, id
+            """,
+            (algorithm_id,)
+        )
+        rows = cursor.fetchall()
+        if not rows:
+            return _Columns(np.empty(0, np.int64), np.empty(0, np.float64), np.empty(0, np.int64), np.empty(0, np.uint8))
+        ids, times, epochs, penalties = zip(*rows)
+        return _Columns(
+            np.array(ids, dtype=np.int64),
+            np.array(times, dtype=np.float64),
+            np.array([epoch or 0 for epoch in epochs], dtype=np.int64),
+            np.array(penalties, dtype=np.uint8),
+        )
+
+    # algorithm_id: int, algorithm the time was added to
+    # time_id: int, id of the new time
+    # time_seconds: float, the time
+    # epoch: int, its timestamp in Unix seconds
+    # Returns: None
+    def append(self, algorithm_id: int, time_id: int, time_seconds: float, epoch: int):
+        """
+        Function: Add a newly committed time, if the algorithm's columns are loaded and do not have it yet
+        Input: algorithm_id (int), time_id (int), time_seconds (float), epoch (int)
+        Outputs: None
+        """
+        with self._lock:
+            columns = self._columns.get(algorithm_id)
+            # A load that ran between the commit and this call already has the time (ids only increase)
+            if columns is not None and (columns.length == 0 or time_id > columns.ids[columns.length - 1]):
+                columns.append(time_id, time_seconds, epoch, 0)
+                self._bump_version(columns)
+
+    # time_id: int, id of the time that changed
+    # plus_two: bool or None, new +2 penalty (None to leave it)
+    # dnf: bool or None, new DNF status (None to leave it)
+    # Returns: None
+    def patch(self, time_id: int, plus_two=None, dnf=None):
+        """
+        Function: Update a time's penalty bits in place after the change was committed
+        Input: time_id (int), plus_two (bool or None), dnf (bool or None)
+        Outputs: None
+        """
+        with self._lock:
+            for columns in self._columns.values():
+                index = columns.find(time_id)
+                if index is None:
+                    continue
+                penalty = int(columns.penalties[index])
+                if plus_two is not None:
+                    penalty = penalty | self.PLUS_TWO if plus_two else penalty & ~self.PLUS_TWO
+                if dnf is not None:
+                    penalty = penalty | self.DNF if dnf else penalty & ~self.DNF
+                columns.penalties[index] = penalty
+                self._bump_version(columns)
+                return
+
+    # time_id: int, id of the time that was deleted
+    # Returns: None
+    def remove(self, time_id: int):
+        with self._lock:
+            for columns in self._columns.values():
+                index = columns.find(time_id)
+                if index is not None:
+                    columns.remove(index)
+                    self._bump_version(columns)
+                    return
+
+    def clear(self):
+        """
+        Function: Drop every loaded algorithm so the next read loads from the database
+        Input: None
+        Outputs: None
+        """
+        with self._lock:
+            self._columns = {}
@@ -0,0 +1,184 @@
+#   Name: Kayden Ye
+#   Date: 17/10/2026
+#   File: classes/write_queue.py
+
+import atexit
+import os
+import queue
+import sqlite3
+import threading
+from .connection_manager import ConnectionManager
+
+class WriteQueue:
+    # Most writes that can wait before submit() blocks the caller
+    MAX_PENDING = 256
+    # Most writes committed together in one transaction
+    MAX_BATCH = 64
+
+    _instances = {}
+    _instances_lock = threading.Lock()
+    _STOP = object()
+
+    # db_path: str, path to the SQLite database file (str for the writer's connection)
+    # Returns: WriteQueue (shared writer for that database)
+    @classmethod
+    def get(cls, db_path: str) -> "WriteQueue":
+        """
+        Function: Get the shared write queue for a database, starting its writer thread the first time
+        Input: db_path (str)
+        Outputs: WriteQueue
+        """
+        key = os.path.abspath(db_path)
+        with cls._instances_lock:
+            instance = cls._instances.get(key)
+            if instance is None or instance._closed:
+                instance = cls(db_path)
+                cls._instances[key] = instance
+            return instance
+
+    @classmethod
+    def close_all(cls):
+        """
+        Function: Flush and stop every writer thread (called on exit)
+        Input: None
+        Outputs: None
+        """
+        with cls._instances_lock:
+            instances = list(cls._instances.values())
+            cls._instances.clear()
+        for instance in instances:
+            instance.close()
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._queue = queue.Queue(maxsize=WriteQueue.MAX_PENDING)
+        # Finished callbacks wait here until the UI thread runs them
+        self._results = queue.Queue()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="cubelab-writer", daemon=True)
+        self._thread.start()
+
+    # job: function, called as job(cursor, *args) on the writer thread (function so callers control the SQL)
+    # *args: values passed to job
+    # callback: function or None, called as callback(success, result) by dispatch_callbacks
+    # on_commit: function or None, called as on_commit(result) on the writer thread once the job is committed
+    #            (for keeping in-memory caches in step with the database)
+    # Returns: None
+    def submit(self, job, *args, callback=None, on_commit=None):
+        """
+        Function: Queue a write to run on the writer thread, blocking only if the queue is full
+        Input: job (function), *args, callback (function or None), on_commit (function or None)
+        Outputs: None
+        """
+        if self._closed:
+            raise RuntimeError("write queue is closed")
+        self._queue.put((job, args, callback, on_commit))
+
+    def flush(self):
+        """
+        Function: Wait until every queued write has been committed
+        Input: None
+        Outputs: None
+        """
+        if not self._closed:
+            self._queue.join()
+
+    def close(self):
+        """
+        Function: Commit the remaining writes and stop the writer thread
+        Input: None
+        Outputs: None
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(WriteQueue._STOP)
+        self._thread.join()
+
+    # Returns: int, number of callbacks run
+    def dispatch_callbacks(self) -> int:
+        """
+        Function: Run callbacks for finished writes, call this from the UI thread
+        Input: None
+        Outputs: Number of callbacks run
+        """
+        count = 0
+        while True:
+            try:
+                callback, success, result = self._results.get_nowait()
+            except queue.Empty:
+                return count
+            try:
+                callback(success, result)
+            except Exception as e:
+                print(f"Error in write callback: {e}")
+            count += 1
+
+    def _run(self):
+        """
+        Function: Writer thread loop, group-commits whatever has queued up since the last commit
+        Input: None
+        Outputs: None
+        """
+        conn = ConnectionManager.get_connection(self.db_path)
+        stopping = False
+        while not stopping:
+            batch = [self._queue.get()]
+            while len(batch) < WriteQueue.MAX_BATCH:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            jobs = [item for item in batch if item is not WriteQueue._STOP]
+            stopping = len(jobs) < len(batch)
+            if jobs:
+                self._write_batch(conn, jobs)
+            for _ in batch:
+                self._queue.task_done()
+
+        ConnectionManager.close_thread_connections()
+
+    # conn: sqlite3.Connection, the writer thread's connection
+    # jobs: list of (job, args, callback, on_commit) tuples
+    # Returns: None
+    def _write_batch(self, conn: sqlite3.Connection, jobs: list):
+        """
+        Function: Run a batch of jobs in one transaction, a failing job is rolled back on its own
+        Input: conn (sqlite3.Connection), jobs (list)
+        Outputs: None (queues the callbacks with each job's outcome)
+        """
+        outcomes = []
+        cursor = conn.cursor()
+        try:
+            cursor.execute("BEGIN")
+            for job, args, callback, on_commit in jobs:
+                cursor.execute("SAVEPOINT job")
+                try:
+                    result = job(cursor, *args)
+                    cursor.execute("RELEASE job")
+                    outcomes.append((callback, True, result, on_commit))
+                except Exception as e:
+                    cursor.execute("ROLLBACK TO job")
+                    cursor.execute("RELEASE job")
+                    outcomes.append((callback, False, e, None))
+            conn.commit()
+        except sqlite3.Error as e:
+            # The commit itself failed, so nothing in the batch was saved
+            try:
+                conn.rollback()
+            except sqlite3.Error:
+                pass
+            print(f"Error committing writes: {e}")
+            outcomes = [(callback, False, e, None) for _, _, callback, _ in jobs]
+
+        for callback, success, result, on_commit in outcomes:
+            if on_commit:
+                try:
+                    on_commit(result)
+                except Exception as e:
+                    print(f"Error after committing write: {e}")
+            if callback:
+                self._results.put((callback, success, result))
+
+atexit.register(WriteQueue.close_all)
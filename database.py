@@ -1,16 +1,11 @@
 import sqlite3
+from classes.connection_manager import ConnectionManager
+from classes.rollups import Rollups
 
-def init_db():
-    """Initialise the SQLite database schema and migrate if needed."""
-    conn = sqlite3.connect("cubelab.db")  # Creates file if it doesn't exist
-    cursor = conn.cursor()
-
-    # Optional but recommended
-    try:
-        cursor.execute("PRAGMA foreign_keys = ON")
-    except Exception:
-        pass
+DB_PATH = "cubelab.db"
 
+def _create_base_schema(cursor):
+    """Migration 1: create the original tables and add the penalty columns to old times tables."""
     # Create table for algorithms
     cursor.execute(
         """
@@ -61,19 +56,385 @@ def init_db():
     )
 
     # Migrate existing times table to include new columns if missing
+    cursor.execute("PRAGMA table_info(times)")
+    cols = {row[1] for row in cursor.fetchall()}
+    if "plus_two" not in cols:
+        cursor.execute("ALTER TABLE times ADD COLUMN plus_two BOOLEAN DEFAULT 0")
+    if "dnf" not in cols:
+        cursor.execute("ALTER TABLE times ADD COLUMN dnf BOOLEAN DEFAULT 0")
+
+def _add_lookup_indexes(cursor):
+    """Migration 2: index the columns that every lookup filters on and make algorithm names unique."""
+    # Older databases could hold duplicate names, rename them so the unique index can be built
+    cursor.execute(
+        """
+        SELECT id, name FROM algorithms
+        WHERE name IN (SELECT name FROM algorithms GROUP BY name HAVING COUNT(*) > 1)
+        ORDER BY name, id
+        """
+    )
+    seen = set()
+    for alg_id, name in cursor.fetchall():
+        if name not in seen:
+            seen.add(name)
+            continue
+        suffix = 2
+        while True:
+            new_name = f"{name} ({suffix})"
+            cursor.execute("SELECT 1 FROM algorithms WHERE name = ?", (new_name,))
+            if cursor.fetchone() is None:
+                break
+            suffix += 1
+        cursor.execute("UPDATE algorithms SET name = ? WHERE id = ?", (new_name, alg_id))
+
+    cursor.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_algorithms_name ON algorithms(name)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_times_algorithm_timestamp ON times(algorithm_id, timestamp)")
+    # The primary key already covers lookups by algorithm_id, this covers lookups by tag
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_algorithm_tags_tag ON algorithm_tags(tag_id)")
+
+def _add_search_index(cursor):
+    """Migration 3: full-text index over algorithm names and notation, kept in sync by triggers."""
+    # The trigram tokenizer matches any substring of 3+ characters, the same matches as the old LIKE search
     try:
-        cursor.execute("PRAGMA table_info(times)")
-        cols = {row[1] for row in cursor.fetchall()}
-        if "plus_two" not in cols:
-            cursor.execute("ALTER TABLE times ADD COLUMN plus_two BOOLEAN DEFAULT 0")
-        if "dnf" not in cols:
-            cursor.execute("ALTER TABLE times ADD COLUMN dnf BOOLEAN DEFAULT 0")
-    except Exception:
-        # If PRAGMA fails, ignore and proceed
-        pass
-
-    conn.commit()
-    conn.close()
+        cursor.execute(
+            """
+            CREATE VIRTUAL TABLE IF NOT EXISTS algorithms_fts USING fts5(
+                name, notation,
+                content='algorithms', content_rowid='id',
+                tokenize='trigram'
+            )
+            """
+        )
+    except sqlite3.OperationalError:
+        # SQLite was built without FTS5 (or is older than 3.34), search falls back to LIKE
+        return
+
+    cursor.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS algorithms_fts_insert AFTER INSERT ON algorithms BEGIN
+            INSERT INTO algorithms_fts(rowid, name, notation) VALUES (new.id, new.name, new.notation);
+        END
+        """
+    )
+    cursor.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS algorithms_fts_delete AFTER DELETE ON algorithms BEGIN
+            INSERT INTO algorithms_fts(algorithms_fts, rowid, name, notation) VALUES ('delete', old.id, old.name, old.notation);
+        END
+        """
+    )
+    cursor.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS algorithms_fts_update AFTER UPDATE OF name, notation ON algorithms BEGIN
+            INSERT INTO algorithms_fts(algorithms_fts, rowid, name, notation) VALUES ('delete', old.id, old.name, old.notation);
+            INSERT INTO algorithms_fts(rowid, name, notation) VALUES (new.id, new.name, new.notation);
+        END
+        """
+    )
+    # Index the algorithms that already exist
+    cursor.execute("INSERT INTO algorithms_fts(algorithms_fts) VALUES ('rebuild')")
+
+def _add_sort_key(cursor):
+    """Migration 4: stored, indexed sort key so algorithm lists are sorted by the database."""
+    from classes.algorithm import Algorithm
+
+    cursor.execute("PRAGMA table_info(algorithms)")
+    cols = {row[1] for row in cursor.fetchall()}
+    if "sort_key" not in cols:
+        cursor.execute("ALTER TABLE algorithms ADD COLUMN sort_key TEXT NOT NULL DEFAULT ''")
+    # The key is made in Python (numbers are zero-padded), so fill it in for existing algorithms
+    cursor.execute("SELECT id, name FROM algorithms")
+    keys = [(Algorithm.make_sort_key(name), alg_id) for alg_id, name in cursor.fetchall()]
+    cursor.executemany("UPDATE algorithms SET sort_key = ? WHERE id = ?", keys)
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_algorithms_sort_key ON algorithms(sort_key)")
+
+def _add_tag_usage_counts(cursor):
+    """Migration 5: count each tag's links with triggers so unused tags are found without scanning every link."""
+    cursor.execute("PRAGMA table_info(tags)")
+    cols = {row[1] for row in cursor.fetchall()}
+    if "usage_count" not in cols:
+        cursor.execute("ALTER TABLE tags ADD COLUMN usage_count INTEGER NOT NULL DEFAULT 0")
+    cursor.execute(
+        "UPDATE tags SET usage_count = (SELECT COUNT(*) FROM algorithm_tags WHERE algorithm_tags.tag_id = tags.id)"
+    )
+    cursor.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS algorithm_tags_count_insert AFTER INSERT ON algorithm_tags BEGIN
+            UPDATE tags SET usage_count = usage_count + 1 WHERE id = new.tag_id;
+        END
+        """
+    )
+    cursor.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS algorithm_tags_count_delete AFTER DELETE ON algorithm_tags BEGIN
+            UPDATE tags SET usage_count = usage_count - 1 WHERE id = old.tag_id;
+        END
+        """
+    )
+    # Only unused tags are in this index, so finding them costs nothing when there are none
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_tags_unused ON tags(id) WHERE usage_count <= 0")
+
+# Aggregates over one algorithm's times for the algorithm_stats columns below. DNFs are counted but left
+# out of the sum, best and worst, matching the dashboard statistics
+_ADJUSTED_TIME = "time_seconds + CASE WHEN COALESCE(plus_two, 0) = 1 THEN 2.0 ELSE 0 END"
+_STATS_COLUMNS = "solve_count, valid_count, dnf_count, time_sum, best, worst, last_timestamp"
+_STATS_AGGREGATES = f"""
+    COUNT(*),
+    COALESCE(SUM(COALESCE(dnf, 0) = 0), 0),
+    COALESCE(SUM(COALESCE(dnf, 0) = 1), 0),
+    COALESCE(SUM(CASE WHEN COALESCE(dnf, 0) = 0 THEN {_ADJUSTED_TIME} END), 0),
+    MIN(CASE WHEN COALESCE(dnf, 0) = 0 THEN {_ADJUSTED_TIME} END),
+    MAX(CASE WHEN COALESCE(dnf, 0) = 0 THEN {_ADJUSTED_TIME} END),
+    MAX(timestamp)
+"""
+
+# Triggers that rebuild an algorithm's stats row when one of its times is changed or deleted
+_STATS_REBUILD_TRIGGERS = (
+    ("times_stats_update", "UPDATE OF time_seconds, plus_two, dnf, timestamp", "new"),
+    ("times_stats_delete", "DELETE", "old"),
+)
+
+# name: str, trigger name
+# event: str, trigger event
+# row: str, 'new' or 'old', the trigger row whose algorithm is rebuilt
+# pb_columns: tuple of str, cached PB columns to clear
+# Returns: str, CREATE TRIGGER statement
+def _stats_rebuild_trigger_sql(name: str, event: str, row: str, pb_columns: tuple) -> str:
+    return f"""
+        CREATE TRIGGER IF NOT EXISTS {name} AFTER {event} ON times BEGIN
+            UPDATE algorithm_stats SET
+                ({_STATS_COLUMNS}) = (SELECT {_STATS_AGGREGATES} FROM times WHERE algorithm_id = {row}.algorithm_id),
+                {"".join(f"{column} = NULL, " for column in pb_columns)}averages_stale = 1,
+                version = version + 1
+            WHERE algorithm_id = {row}.algorithm_id;
+        END
+    """
+
+def _add_algorithm_stats(cursor):
+    """Migration 6: per-algorithm statistics kept current by triggers, so the dashboard and list read one row."""
+    # ao5_pb and ao12_pb are cached by TimerUtil, averages_stale marks them for recomputing and
+    # version lets a reader that recomputed them check nothing changed before saving them
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS algorithm_stats (
+            algorithm_id INTEGER PRIMARY KEY,
+            solve_count INTEGER NOT NULL DEFAULT 0,
+            valid_count INTEGER NOT NULL DEFAULT 0,
+            dnf_count INTEGER NOT NULL DEFAULT 0,
+            time_sum REAL NOT NULL DEFAULT 0,
+            best REAL,
+            worst REAL,
+            last_timestamp DATETIME,
+            ao5_pb REAL,
+            ao12_pb REAL,
+            averages_stale INTEGER NOT NULL DEFAULT 1,
+            version INTEGER NOT NULL DEFAULT 0,
+            FOREIGN KEY (algorithm_id) REFERENCES algorithms(id)
+        )
+        """
+    )
+    cursor.execute(
+        f"""
+        INSERT OR REPLACE INTO algorithm_stats (algorithm_id, {_STATS_COLUMNS})
+        SELECT algorithm_id, {_STATS_AGGREGATES}
+        FROM times
+        WHERE algorithm_id IN (SELECT id FROM algorithms)
+        GROUP BY algorithm_id
+        """
+    )
+
+    # A new time can only raise the counts and widen best/worst, so inserts update the row in place
+    adjusted = "(new.time_seconds + CASE WHEN COALESCE(new.plus_two, 0) = 1 THEN 2.0 ELSE 0 END)"
+    valid = "(COALESCE(new.dnf, 0) = 0)"
+    cursor.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS times_stats_insert AFTER INSERT ON times BEGIN
+            INSERT OR IGNORE INTO algorithm_stats (algorithm_id, averages_stale) VALUES (new.algorithm_id, 0);
+            UPDATE algorithm_stats SET
+                solve_count = solve_count + 1,
+                valid_count = valid_count + {valid},
+                dnf_count = dnf_count + (NOT {valid}),
+                time_sum = time_sum + CASE WHEN {valid} THEN {adjusted} ELSE 0 END,
+                best = CASE WHEN {valid} THEN MIN(COALESCE(best, {adjusted}), {adjusted}) ELSE best END,
+                worst = CASE WHEN {valid} THEN MAX(COALESCE(worst, {adjusted}), {adjusted}) ELSE worst END,
+                last_timestamp = MAX(COALESCE(last_timestamp, new.timestamp), new.timestamp),
+                version = version + 1
+            WHERE algorithm_id = new.algorithm_id;
+        END
+        """
+    )
+    # Penalty changes and deletes can take away the best or worst time, so the row is rebuilt from that
+    # algorithm's times (one indexed range) and the cached averages are recomputed when next read
+    for name, event, row in _STATS_REBUILD_TRIGGERS:
+        cursor.execute(_stats_rebuild_trigger_sql(name, event, row, ("ao5_pb", "ao12_pb")))
+    cursor.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS algorithms_stats_delete AFTER DELETE ON algorithms BEGIN
+            DELETE FROM algorithm_stats WHERE algorithm_id = old.id;
+        END
+        """
+    )
+
+def _add_long_average_pbs(cursor):
+    """Migration 7: cache ao50 and ao100 PBs too, and recompute every cached PB now that DNFs count in averages."""
+    cursor.execute("PRAGMA table_info(algorithm_stats)")
+    cols = {row[1] for row in cursor.fetchall()}
+    for column in ("ao50_pb", "ao100_pb"):
+        if column not in cols:
+            cursor.execute(f"ALTER TABLE algorithm_stats ADD COLUMN {column} REAL")
+    # Cached PBs skipped DNFs before, they are recomputed the next time each algorithm is opened
+    cursor.execute("UPDATE algorithm_stats SET averages_stale = 1, version = version + 1")
+
+def _add_time_rollups(cursor):
+    """Migration 8: daily and weekly aggregates per algorithm, so long-range views read one row per bucket."""
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS time_rollups (
+            algorithm_id INTEGER NOT NULL,
+            period TEXT NOT NULL,
+            bucket TEXT NOT NULL,
+            solve_count INTEGER NOT NULL DEFAULT 0,
+            dnf_count INTEGER NOT NULL DEFAULT 0,
+            time_sum REAL NOT NULL DEFAULT 0,
+            time_sum_sq REAL NOT NULL DEFAULT 0,
+            best REAL,
+            worst REAL,
+            PRIMARY KEY (algorithm_id, period, bucket)
+        ) WITHOUT ROWID
+        """
+    )
+    Rollups.rebuild(cursor)
+
+    # Inserts add the new time to its buckets (creating them if needed)
+    adjusted = "(new.time_seconds + CASE WHEN COALESCE(new.plus_two, 0) = 1 THEN 2.0 ELSE 0 END)"
+    valid = "(COALESCE(new.dnf, 0) = 0)"
+    upserts = "".join(
+        f"""
+            INSERT INTO time_rollups (algorithm_id, period, bucket, {Rollups.COLUMNS})
+            VALUES (
+                new.algorithm_id, '{period}', {bucket.format(ts="new.timestamp")}, 1, NOT {valid},
+                CASE WHEN {valid} THEN {adjusted} ELSE 0 END,
+                CASE WHEN {valid} THEN {adjusted} * {adjusted} ELSE 0 END,
+                CASE WHEN {valid} THEN {adjusted} END,
+                CASE WHEN {valid} THEN {adjusted} END
+            )
+            ON CONFLICT (algorithm_id, period, bucket) DO UPDATE SET
+                solve_count = solve_count + 1,
+                dnf_count = dnf_count + excluded.dnf_count,
+                time_sum = time_sum + excluded.time_sum,
+                time_sum_sq = time_sum_sq + excluded.time_sum_sq,
+                best = MIN(COALESCE(best, excluded.best), COALESCE(excluded.best, best)),
+                worst = MAX(COALESCE(worst, excluded.worst), COALESCE(excluded.worst, worst));
+        """
+        for period, bucket in Rollups.PERIODS.items()
+    )
+    cursor.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS times_rollups_insert AFTER INSERT ON times
+        WHEN new.algorithm_id IS NOT NULL AND new.timestamp IS NOT NULL BEGIN
+            {upserts}
+        END
+        """
+    )
+    # Penalty changes and deletes rebuild the affected buckets (one indexed range each)
+    cursor.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS times_rollups_update AFTER UPDATE OF time_seconds, plus_two, dnf, timestamp ON times BEGIN
+            {"".join(Rollups.rebuild_bucket_sql(period, "old") + Rollups.rebuild_bucket_sql(period, "new") for period in Rollups.PERIODS)}
+        END
+        """
+    )
+    cursor.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS times_rollups_delete AFTER DELETE ON times BEGIN
+            {"".join(Rollups.rebuild_bucket_sql(period, "old") for period in Rollups.PERIODS)}
+        END
+        """
+    )
+    cursor.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS algorithms_rollups_delete AFTER DELETE ON algorithms BEGIN
+            DELETE FROM time_rollups WHERE algorithm_id = old.id;
+        END
+        """
+    )
+
+def _add_time_sketches(cursor):
+    """Migration 9: a stored t-digest of each algorithm's valid times, for percentiles and quick histograms."""
+    # digest is NULL until it is first built (TimerUtil builds it from the times when it is read)
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS time_sketches (
+            algorithm_id INTEGER PRIMARY KEY,
+            digest TEXT,
+            FOREIGN KEY (algorithm_id) REFERENCES algorithms(id)
+        )
+        """
+    )
+    # Saved times are added to the digest by TimerUtil, but a digest cannot take a value back out,
+    # so penalty changes and deletes mark it to be rebuilt
+    for name, event, row in (
+        ("times_sketch_update", "UPDATE OF time_seconds, plus_two, dnf", "new"),
+        ("times_sketch_delete", "DELETE", "old"),
+    ):
+        cursor.execute(
+            f"""
+            CREATE TRIGGER IF NOT EXISTS {name} AFTER {event} ON times BEGIN
+                UPDATE time_sketches SET digest = NULL WHERE algorithm_id = {row}.algorithm_id;
+            END
+            """
+        )
+    cursor.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS algorithms_sketch_delete AFTER DELETE ON algorithms BEGIN
+            DELETE FROM time_sketches WHERE algorithm_id = old.id;
+        END
+        """
+    )
+
+def _clear_long_average_pbs_on_change(cursor):
+    """Migration 10: penalty changes and deletes clear the ao50 and ao100 PBs too, not only ao5 and ao12."""
+    # Migration 6's triggers were made before those columns existed, so stale rows kept old long PBs
+    for name, event, row in _STATS_REBUILD_TRIGGERS:
+        cursor.execute(f"DROP TRIGGER IF EXISTS {name}")
+        cursor.execute(_stats_rebuild_trigger_sql(name, event, row, ("ao5_pb", "ao12_pb", "ao50_pb", "ao100_pb")))
+    cursor.execute("UPDATE algorithm_stats SET ao50_pb = NULL, ao100_pb = NULL WHERE averages_stale = 1")
+
+# Applied in order, the database's PRAGMA user_version is the number of migrations already applied
+MIGRATIONS = [
+    _create_base_schema,
+    _add_lookup_indexes,
+    _add_search_index,
+    _add_sort_key,
+    _add_tag_usage_counts,
+    _add_algorithm_stats,
+    _add_long_average_pbs,
+    _add_time_rollups,
+    _add_time_sketches,
+    _clear_long_average_pbs_on_change,
+]
+
+def init_db(db_path: str = DB_PATH):
+    """Initialise the SQLite database schema and migrate if needed."""
+    conn = ConnectionManager.get_connection(db_path)  # Creates file if it doesn't exist
+    cursor = conn.cursor()
+
+    cursor.execute("PRAGMA user_version")
+    version = cursor.fetchone()[0]
+    if version >= len(MIGRATIONS):
+        # Schema is already current
+        return
+
+    for number in range(version, len(MIGRATIONS)):
+        # Each migration and its version bump are committed together
+        cursor.execute("BEGIN")
+        try:
+            MIGRATIONS[number](cursor)
+            cursor.execute(f"PRAGMA user_version = {number + 1}")
+            conn.commit()
+        except sqlite3.Error:
+            conn.rollback()
+            raise
 
 if __name__ == "__main__":
-    init_db()
\ No newline at end of file
+    init_db()
@@ -38,6 +38,8 @@ class AlgorithmList(ctk.CTkFrame):
         
         # State
         self.filter_tags = set()
+        self.exclude_tags = set()
+        self.tag_mode = "any"
         self.sort_order = "asc"
         
         self.setup_ui()
@@ -100,17 +102,15 @@ class AlgorithmList(ctk.CTkFrame):
         for widget in self.scrollable_list.winfo_children():
             widget.destroy()
         
-        # Get algorithms
-        algorithms = self.algorithm.get_algorithms_with_filters(
-            search_query, self.filter_tags, self.sort_order
+        # Get algorithms with their solve counts in the same query
+        rows = self.algorithm.get_algorithms_with_filters(
+            search_query, self.filter_tags, self.sort_order,
+            tag_mode=self.tag_mode, exclude_tags=self.exclude_tags, with_stats=True
         )
+        algorithms = [row[0] for row in rows]
         
         # Create algorithm list
-        for name in algorithms:
-            count = 0
-            if self.show_count:
-                count = self.timer_util.get_time_count(name)
-            
+        for name, count, _, _ in rows:
             item = AlgorithmListItem(
                 self.scrollable_list,
                 name=name,
@@ -259,17 +259,33 @@ class AlgorithmList(ctk.CTkFrame):
         
         # Tags section
         ctk.CTkLabel(content_frame, text="Filter by tags", font=(FONT, 16, "bold")).pack(anchor="w", pady=(0, 8))
-        tags_frame = ctk.CTkScrollableFrame(content_frame, height=220, fg_color="transparent")
+        
+        # Whether included tags are combined with OR or AND
+        mode_options = {"Match any tag": "any", "Match all tags": "all"}
+        mode_menu = ctk.CTkOptionMenu(content_frame, values=list(mode_options), width=280)
+        mode_menu.set(next(label for label, mode in mode_options.items() if mode == self.tag_mode))
+        mode_menu.pack(anchor="w", pady=(0, 8))
+        
+        tags_frame = ctk.CTkScrollableFrame(content_frame, height=180, fg_color="transparent")
         tags_frame.pack(fill="x", pady=(0, 12))
         
-        tag_vars = {}
+        # Each tag can be ignored, required (Include) or ruled out (Exclude)
+        tag_buttons = {}
         tags = self.algorithm.get_all_tags()
         if tags:
             for tag in tags:
-                var = ctk.BooleanVar(value=(tag in self.filter_tags))
-                cb = ctk.CTkCheckBox(tags_frame, text=tag, variable=var)
-                cb.pack(anchor="w", pady=2)
-                tag_vars[tag] = var
+                row = ctk.CTkFrame(tags_frame, fg_color="transparent")
+                row.pack(fill="x", pady=2)
+                ctk.CTkLabel(row, text=tag).pack(side="left")
+                state = ctk.CTkSegmentedButton(row, values=["Off", "Include", "Exclude"], width=170)
+                if tag in self.filter_tags:
+                    state.set("Include")
+                elif tag in self.exclude_tags:
+                    state.set("Exclude")
+                else:
+                    state.set("Off")
+                state.pack(side="right")
+                tag_buttons[tag] = state
         else:
             ctk.CTkLabel(tags_frame, text="No tags found.", text_color="gray").pack(anchor="w", pady=4)
         
@@ -278,8 +294,18 @@ class AlgorithmList(ctk.CTkFrame):
         sort_content_frame.pack(anchor="w", padx=20, pady=20, fill="both", expand=True)
         
         ctk.CTkLabel(sort_content_frame, text="Sort", font=(FONT, 16, "bold")).pack(anchor="w", pady=(0, 6))
-        sort_values = ["A-Z", "Z-A"]
-        current_sort = "A-Z" if self.sort_order == "asc" else "Z-A"
+        # Relevance orders by best search match, and falls back to A-Z when not searching
+        sort_options = {
+            "A-Z": "asc",
+            "Z-A": "desc",
+            "Relevance": "relevance",
+            "Most solves": "most_solves",
+            "Last practiced": "last_practiced",
+            "Best PB": "best_pb",
+            "Best ao12": "best_ao12",
+        }
+        sort_values = list(sort_options)
+        current_sort = next((label for label, order in sort_options.items() if order == self.sort_order), "A-Z")
         sort_menu = ctk.CTkOptionMenu(sort_content_frame, values=sort_values, width=280)
         sort_menu.set(current_sort)
         sort_menu.pack(anchor="w")
@@ -289,14 +315,17 @@ class AlgorithmList(ctk.CTkFrame):
         button_frame.pack(side="bottom", anchor="se", padx=20, pady=20)
         
         def apply_and_close():
-            self.filter_tags = {name for name, var in tag_vars.items() if var.get()}
-            sel = sort_menu.get()
-            self.sort_order = "asc" if sel == "A-Z" else "desc"
+            self.filter_tags = {name for name, state in tag_buttons.items() if state.get() == "Include"}
+            self.exclude_tags = {name for name, state in tag_buttons.items() if state.get() == "Exclude"}
+            self.tag_mode = mode_options.get(mode_menu.get(), "any")
+            self.sort_order = sort_options.get(sort_menu.get(), "asc")
             self.refresh()
             dlg.destroy()
         
         def clear_and_close():
             self.filter_tags = set()
+            self.exclude_tags = set()
+            self.tag_mode = "any"
             self.sort_order = "asc"
             self.refresh()
             dlg.destroy()
@@ -3,14 +3,19 @@
 #   File: gui/dashboard.py
 
 import customtkinter as ctk
-from classes.algorithm import Algorithm
 from classes.timer_util import TimerUtil
+from classes.stats import AverageStats
+from classes.dashboard_snapshot import DashboardSnapshot
+from classes.background_loader import LatestOnlyLoader
+from classes.downsample import Downsampler
+from classes.averages import AveragesEngine
+from classes.lru_cache import LRUCache
 from .components import HeaderFrame, FONT
 from .algorithm_list import AlgorithmList
 import tkinter as tk
 from PIL import Image, ImageTk
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 import numpy as np
 
 class DashboardCard(ctk.CTkFrame):    
@@ -33,7 +38,6 @@ class AlgorithmCard(DashboardCard):
         Outputs: None
         """
         super().__init__(parent, **kwargs)
-        self.algorithm = Algorithm()
         self.setup_ui()
 
     def setup_ui(self):
@@ -54,24 +58,18 @@ class AlgorithmCard(DashboardCard):
         cube_frame = ctk.CTkFrame(self, fg_color="transparent")
         cube_frame.pack(expand=True)
 
-    def update_algorithm(self, algorithm_name):
+    def update_algorithm(self, snapshot: DashboardSnapshot):
         """
         Function: Update card with algorithm data
-        Input: algorithm_name (str), name of the algorithm to display
+        Input: snapshot (DashboardSnapshot), data of the algorithm to display
         Outputs: None
         """
-        try:
-            details = self.algorithm.get_algorithm_details(algorithm_name)
-            if details:
-                notation, tags = details
-                self.title_label.configure(text=algorithm_name)
-                self.notation_label.configure(text=notation)
-            else:
-                self.title_label.configure(text="Algorithm Not Found")
-                self.notation_label.configure(text="No notation available")
-        except Exception as e:
-            self.title_label.configure(text="Error Loading")
-            self.notation_label.configure(text="Could not load algorithm data")
+        if snapshot.found:
+            self.title_label.configure(text=snapshot.name)
+            self.notation_label.configure(text=snapshot.notation)
+        else:
+            self.title_label.configure(text="Algorithm Not Found")
+            self.notation_label.configure(text="No notation available")
 
     def reset_to_default(self):
         """
@@ -88,7 +86,6 @@ class TagsCard(DashboardCard):
     # Returns: None
     def __init__(self, parent, **kwargs):
         super().__init__(parent, **kwargs)
-        self.algorithm = Algorithm()
         self.setup_ui()
     
     def setup_ui(self):
@@ -100,12 +97,12 @@ class TagsCard(DashboardCard):
         self.default_label = ctk.CTkLabel(self.tags_frame, text="Select an algorithm to view tags", font=(FONT, 14), text_color="gray")
         self.default_label.pack(expand=True)
     
-    # algorithm_name: str, name of the algorithm to display tags for (str for searching for algorithm)
+    # snapshot: DashboardSnapshot, data of the algorithm to display tags for
     # Returns: None
-    def update_tags(self, algorithm_name: str):
+    def update_tags(self, snapshot: DashboardSnapshot):
         """
         Function: Update tags displayed on the card
-        Input: algorithm_name (str), name of the algorithm to display tags for
+        Input: snapshot (DashboardSnapshot), data of the algorithm to display tags for
         Outputs: None
         """
         # Clear existing tags
@@ -113,10 +110,8 @@ class TagsCard(DashboardCard):
             widget.destroy()
         
         try:
-            # Get algorithm details
-            details = self.algorithm.get_algorithm_details(algorithm_name)
-            if details:
-                notation, tags = details
+            if snapshot.found:
+                tags = snapshot.tags
                 if tags:
                     row = 0
                     col = 0
@@ -159,120 +154,274 @@ class TagsCard(DashboardCard):
         self.default_label = ctk.CTkLabel(self.tags_frame, text="Select an algorithm to view tags", font=(FONT, 14), text_color="gray")
         self.default_label.pack(expand=True)
 
-class BarChartCard(DashboardCard):
+class ChartCard(DashboardCard):
+    # A card holding one matplotlib figure that lives as long as the card. The figure is drawn with Agg on the
+    # card's render thread and only the finished image is shown on the Tk thread, so key presses for the
+    # stopwatch are never held up by a chart. Only the render thread touches the figure after setup
+    # Milliseconds between checks for a finished render
+    RENDER_POLL_MS = 15
+    # Data drawn when the card is empty (or drawing the real data failed)
+    EMPTY = None
+    # Rendered images kept for reselecting algorithms, each chart class gets its own
+    IMAGE_CACHE_SIZE = 24
+    # Milliseconds the card's size must stay the same before the chart is drawn at the new size
+    RESIZE_DEBOUNCE_MS = 150
+    # Space around the image, in the same units as CTk widget sizes
+    IMAGE_PADDING = 10
+    # Matplotlib's dots per inch at 100% scaling, multiplied by the window's scaling on high DPI screens
+    BASE_DPI = 100
+    image_cache = None
+
     # parent: CTk widget, container for the card (CTkFrame for layout flexibility)
     # **kwargs: dict, allows passing extra options to CTkFrame (flexible for UI)
     # Returns: None
     def __init__(self, parent, **kwargs):
         super().__init__(parent, **kwargs)
-        self.timer_util = TimerUtil()
-        self.canvas = None
-        self.fig = None
-        self.ax = None
+        # Figure is used directly (not pyplot) so no figures are left in pyplot's global state
+        self.fig = Figure(figsize=(3, 2.5), dpi=100, facecolor='#33363D', layout='constrained')
+        self.canvas = FigureCanvasAgg(self.fig)
+        self.ax = self.fig.add_subplot()
+        self.ax.set_facecolor('#33363D')
+        self.ax.tick_params(colors='gray', labelcolor='gray')
+
+        # Remove spines
+        for spine in self.ax.spines.values():
+            spine.set_visible(False)
+
+        # Grid
+        self.ax.grid(True, alpha=0.3, color='gray')
+        self.ax.set_axisbelow(True)
+
+        # Empty state message, shown instead of the data
+        self.empty_text = self.ax.text(0.5, 0.5, 'No Data', transform=self.ax.transAxes,
+                                       ha='center', va='center', color='gray', fontsize=12)
+
+        # The rendered chart is shown as an image, the label is never recreated
+        self.image_label = ctk.CTkLabel(self, text="", fg_color="transparent")
+        self.image_label.pack(fill="both", expand=True, padx=ChartCard.IMAGE_PADDING, pady=ChartCard.IMAGE_PADDING)
+
+        # One render thread per card, only the newest update is drawn
+        self.renderer = LatestOnlyLoader("cubelab-chart")
+        self._render_poll_id = None
+        # render_size (tuple of int): size of the rendered image in pixels, render_dpi (float): its dots per inch
+        self.render_size = self.canvas.get_width_height(physical=True)
+        self.render_dpi = self.fig.dpi
+        # Last data shown, drawn again when the card is resized
+        self._last_chart = (self.EMPTY, None)
         self._resize_after_id = None
-        self._resize_bound = False
-        self.setup_ui()
-    
-    def setup_ui(self):
-        self.create_chart([])
-        # self._bind_resize()
-    
-    # times_data: list, list of times, tuples for chart (list for multiple times)
+        self.bind("<Configure>", self._on_configure, add=True)
+
+        # The cache is kept on the class so it outlives the dashboard, which is rebuilt each time it is shown
+        if type(self).image_cache is None:
+            type(self).image_cache = LRUCache(ChartCard.IMAGE_CACHE_SIZE)
+
+    # has_data: bool, True to show the data artists, False for the empty state
     # Returns: None
-    def create_chart(self, times_data):
+    def _show_data(self, has_data: bool):
+        self.empty_text.set_visible(not has_data)
+
+    # data: chart data for draw_chart (type depends on the card)
+    # Returns: None
+    def draw_chart(self, data):
         """
-        Function: Create or update the bar chart
-        Input: times_data (list), list of times, tuples for chart
+        Function: Update the figure's artists for new data (runs on the render thread). Each chart adds its own
+                  artists, the base card only has the empty state, so it shows that
+        Input: data
         Outputs: None
         """
-        # Clear existing chart widget
-        for widget in self.winfo_children():
-            widget.destroy()
-        # Close existing fig if there is any
+        self._show_data(False)
+
+    # data: chart data for draw_chart (type depends on the card)
+    # data_version: tuple or None, DashboardSnapshot.data_version of the data, None to not cache the image
+    # Returns: None
+    def create_chart(self, data, data_version=None):
+        """
+        Function: Draw the chart for new data in the background, the image is swapped in when it is ready.
+                  An image already rendered for the same data, size and theme is shown straight away
+        Input: data, data_version (tuple or None)
+        Outputs: None
+        """
+        self._last_chart = (data, data_version)
+        key = None
+        if data_version is not None:
+            # The version changes with every saved, changed or deleted time, so old images are never matched
+            key = (*data_version, self.render_size, self.render_dpi, ctk.get_appearance_mode())
+            image = self.image_cache.get(key)
+            if image is not None:
+                self.renderer.cancel()
+                self.image_label.configure(image=image)
+                return
+        self.renderer.submit(self._render, data, key, self.render_size, self.render_dpi)
+        if self._render_poll_id is None:
+            self._render_poll_id = self.after(ChartCard.RENDER_POLL_MS, self._poll_render)
+
+    # data: chart data for draw_chart
+    # key: tuple or None, image cache key for the result
+    # size: tuple of int, image size in pixels
+    # dpi: float, dots per inch to draw at (bigger on high DPI screens so text stays the same size)
+    # Returns: tuple (key, PIL Image), the rendered chart (RGBA)
+    def _render(self, data, key, size, dpi):
+        """
+        Function: Update the artists and rasterise the figure with Agg (runs on the render thread)
+        Input: data, key (tuple or None), size (tuple of int), dpi (float)
+        Outputs: Tuple of the cache key and PIL Image
+        """
+        if self.canvas.get_width_height(physical=True) != tuple(size) or self.fig.dpi != dpi:
+            self.fig.set_dpi(dpi)
+            self.fig.set_size_inches(size[0] / dpi, size[1] / dpi)
         try:
-            if self.fig is not None:
-                plt.close(self.fig)
+            self.draw_chart(data)
         except Exception:
-            pass
-        
-        # Create matplotlib figure
-        fig, ax = plt.subplots(figsize=(3, 2.5), facecolor='#33363D', constrained_layout=True)
-        fig.set_dpi(100)
-        ax.set_facecolor('#33363D')
-        self.fig, self.ax = fig, ax
-        
-        if times_data:
-            # Create histogram of times
-            times = [float(t[0]) for t in times_data]
-            bins = 10
-            counts, bin_edges = np.histogram(times, bins=bins)
-
-            # Define range of values and get the centre 
-            bin_centres = [(bin_edges[i] + bin_edges[i+1]) / 2 for i in range(len(bin_edges) - 1)]
-            
-            # Create bars
-            ax.bar(range(len(counts)), counts, color='#4A9EFF', width=0.8)
-            
-            ax.set_xticks(range(len(bin_centres)))
-            # Make tick labels for the x-axis (showing bin centres)
-            labels = [f'{x:.1f}' for x in bin_centres]
-            # If there are too many labels, reduce amount of labels
-            if len(labels) > 10:
-                step = max(1, len(labels) // 10) # Show about 10 labels at most
-                ax.set_xticks(list(range(0, len(labels), step))) 
-                labels = labels[::step]
-
-            ax.set_xticklabels(labels, color='gray', fontsize=8, rotation=45)
-            ax.set_ylabel('Count', color='gray', fontsize=8)
-        else:
-            # Show empty state
-            ax.text(0.5, 0.5, 'No Data', transform=ax.transAxes,
-                    ha='center', va='center', color='gray', fontsize=12)
-        
-        ax.tick_params(colors='gray')
-        
-        # Remove spines from histogram
-        for spine in ax.spines.values():
-            spine.set_visible(False)
-        
-        # Grid
-        ax.grid(True, alpha=0.3, color='gray')
-        ax.set_axisbelow(True)
-        
-        self.canvas = FigureCanvasTkAgg(fig, self)
+            self.draw_chart(self.EMPTY)
+            key = None
         self.canvas.draw()
-        self.canvas.get_tk_widget().pack(fill="both", expand=True, padx=10, pady=10)
+        width, height = self.canvas.get_width_height(physical=True)
+        # Agg reuses its buffer for the next draw, so the image gets its own copy here rather than on the Tk thread
+        return key, Image.frombuffer("RGBA", (width, height), self.canvas.buffer_rgba(), "raw", "RGBA", 0, 1).copy()
+
+    def _poll_render(self):
+        """
+        Function: Show the newest rendered image once it is ready
+        Input: None
+        Outputs: None
+        """
+        self._render_poll_id = None
+        try:
+            done, result = self.renderer.poll()
+        except Exception as e:
+            print(f"Error rendering chart: {e}")
+            return
+        if done:
+            key, rendered = result
+            # CTkImage sizes are scaled by the window's scaling, so divide it out to show the image pixel for pixel
+            scaling = self._get_widget_scaling()
+            image = ctk.CTkImage(light_image=rendered, dark_image=rendered,
+                                 size=(rendered.width / scaling, rendered.height / scaling))
+            if key is not None:
+                self.image_cache.put(key, image)
+            self.image_label.configure(image=image)
+        if self.renderer.pending():
+            self._render_poll_id = self.after(ChartCard.RENDER_POLL_MS, self._poll_render)
+
+    # event: tk.Event, the card's new size in pixels
+    # Returns: None
+    def _on_configure(self, event):
+        """
+        Function: Wait for resizing to settle before drawing the chart at the card's new size
+        Input: event (tk.Event)
+        Outputs: None
+        """
+        if self._resize_after_id is not None:
+            self.after_cancel(self._resize_after_id)
+        self._resize_after_id = self.after(ChartCard.RESIZE_DEBOUNCE_MS, self._apply_resize, event.width, event.height)
+
+    # width: int, card width in pixels
+    # height: int, card height in pixels
+    # Returns: None
+    def _apply_resize(self, width: int, height: int):
+        """
+        Function: Draw the last data again at the real pixel size and DPI of the card
+        Input: width (int), height (int)
+        Outputs: None
+        """
+        self._resize_after_id = None
+        scaling = self._get_widget_scaling()
+        padding = round(2 * ChartCard.IMAGE_PADDING * scaling)
+        size = (width - padding, height - padding)
+        dpi = ChartCard.BASE_DPI * scaling
+        # Ignore sizes from before the card is laid out, and sizes that did not change
+        if min(size) < 50 or (size == tuple(self.render_size) and dpi == self.render_dpi):
+            return
+        self.render_size = size
+        self.render_dpi = dpi
+        self.create_chart(*self._last_chart)
 
     def destroy(self):
         """
-        Function: Clean up matplotlib resources
+        Function: Stop rendering and clean up matplotlib resources
         Input: None
         Outputs: None
         """
         try:
-            if hasattr(self, 'canvas') and self.canvas:
-                self.canvas.get_tk_widget().destroy()
-                self.canvas = None
-            self.fig = None
-            self.ax = None
-            plt.close('all')
-        except:
+            if self._render_poll_id is not None:
+                self.after_cancel(self._render_poll_id)
+                self._render_poll_id = None
+            if self._resize_after_id is not None:
+                self.after_cancel(self._resize_after_id)
+                self._resize_after_id = None
+            self.renderer.shutdown()
+        except Exception:
             pass
         super().destroy()
+
+class BarChartCard(ChartCard):
+    # Number of bars in the histogram
+    BINS = 10
+    # Histories up to this many valid times are counted exactly, longer ones use the stored t-digest
+    EXACT_LIMIT = 100000
+
+    # parent: CTk widget, container for the card (CTkFrame for layout flexibility)
+    # **kwargs: dict, allows passing extra options to CTkFrame (flexible for UI)
+    # Returns: None
+    def __init__(self, parent, **kwargs):
+        super().__init__(parent, **kwargs)
+        self.setup_ui()
+    
+    def setup_ui(self):
+        # The bars are made once, updates only change their heights
+        self.bars = self.ax.bar(range(BarChartCard.BINS), [0] * BarChartCard.BINS, color='#4A9EFF', width=0.8)
+        self.ax.set_xticks(range(BarChartCard.BINS))
+        self.ax.set_ylabel('Count', color='gray', fontsize=8)
+        self.create_chart(None)
+    
+    # data: tuple (results: numpy array, sketch: TDigest) or None, every result (DNF as infinity) and the
+    #       sketch of the valid times
+    # Returns: None
+    def draw_chart(self, data):
+        """
+        Function: Update the bars (runs on the render thread)
+        Input: data (tuple or None), times for chart
+        Outputs: None
+        """
+        has_data = False
+        if data is not None:
+            results, sketch = data
+            times = results[np.isfinite(results)]
+            has_data = len(times) > 0
+        if has_data:
+            if len(times) <= BarChartCard.EXACT_LIMIT:
+                counts, bin_edges = np.histogram(times, bins=BarChartCard.BINS)
+            else:
+                # Approximate histogram from the stored sketch, so huge histories are not binned on every draw
+                counts, bin_edges = sketch.histogram(BarChartCard.BINS)
+
+            # Define range of values and get the centre 
+            bin_centres = [(bin_edges[i] + bin_edges[i+1]) / 2 for i in range(len(bin_edges) - 1)]
+        else:
+            counts, bin_centres = [0] * BarChartCard.BINS, []
+
+        for bar, count in zip(self.bars, counts):
+            bar.set_height(count)
+            bar.set_visible(has_data)
+
+        # Make tick labels for the x-axis (showing bin centres)
+        self.ax.set_xticklabels([f'{x:.1f}' for x in bin_centres], color='gray', fontsize=8, rotation=45)
+        self.ax.set_ylim(0, max(counts) * 1.05 if has_data else 1)
+        self.ax.yaxis.label.set_visible(has_data)
+        self._show_data(has_data)
     
-    # algorithm_name: str, name of the algorithm to update chart for (str for searching for algorithm)
+    # snapshot: DashboardSnapshot, data of the algorithm to update chart for
     # Returns: None
-    def update_algorithm(self, algorithm_name):
+    def update_algorithm(self, snapshot: DashboardSnapshot):
         """
         Function: Update chart with algorithm times
-        Input: algorithm_name (str), name of the algorithm to update chart for
+        Input: snapshot (DashboardSnapshot), data of the algorithm to update chart for
         Outputs: None
         """
         try:
-            times_data = self.timer_util.get_algorithm_times(algorithm_name)
-            self.create_chart(times_data)
+            self.create_chart((snapshot.results(), snapshot.sketch), snapshot.data_version())
         except Exception as e:
-            self.create_chart([])
+            self.create_chart(None)
     
     def reset_to_default(self):
         """
@@ -280,7 +429,7 @@ class BarChartCard(DashboardCard):
         Input: None
         Outputs: None
         """
-        self.create_chart([])
+        self.create_chart(None)
 
 class TimerListCard(DashboardCard):
     # parent: CTk widget, container for the card (CTkFrame for layout flexibility)
@@ -308,20 +457,21 @@ class TimerListCard(DashboardCard):
         self.default_label = ctk.CTkLabel(self.scrollable, text="Select an algorithm to view times", font=(FONT, 14), text_color="gray")
         self.default_label.pack(expand=True, pady=20)
     
-    # algorithm_name: str, name of the algorithm to display times for (str for search)
+    # snapshot: DashboardSnapshot, data of the algorithm to display times for
     # Returns: None
-    def update_times(self, algorithm_name: str):
+    def update_times(self, snapshot: DashboardSnapshot):
         """
         Functions: Update the displayed times for the selected algorithm
-        Input: algorithm_name (str), the name of the algorithm to display times for
+        Input: snapshot (DashboardSnapshot), data of the algorithm to display times for
         Output: None
         """
         # Clear existing times
         for widget in self.scrollable.winfo_children():
             widget.destroy()
         
-        # Get times for the algorithm with IDs and penalty flags
-        times_data = self.timer_util.get_algorithm_times_with_ids(algorithm_name)
+        # Times for the algorithm with IDs and penalty flags, newest first
+        times_data = snapshot.rows()
+        algorithm_name = snapshot.name
         
         if not times_data:
             no_times_label = ctk.CTkLabel(self.scrollable, text="No times recorded yet", font=(FONT, 14), text_color="gray")
@@ -330,7 +480,7 @@ class TimerListCard(DashboardCard):
         
         total_times = len(times_data)
         
-        for i, (time_id, time_seconds, timestamp, plus_two, dnf) in enumerate(times_data):
+        for i, (time_id, time_seconds, epoch, plus_two, dnf) in enumerate(times_data):
             row_frame = ctk.CTkFrame(self.scrollable, fg_color="transparent")
             row_frame.pack(fill="x", pady=1)
 
@@ -393,11 +543,10 @@ class TimerListCard(DashboardCard):
         Input: time_id (int) to identify the time entry, algorithm_name (str) for algorithm search
         Output: None
         """
-        if self.timer_util.update_time_penalty(time_id, plus_two=True):
-            self.update_times(algorithm_name) # Refresh the display
-            # Update other dashboard cards
-            if self.dashboard:
-                self.dashboard.on_algorithm_select(algorithm_name)
+        self.timer_util.update_time_penalty_async(
+            time_id, plus_two=True,
+            callback=lambda success: self._on_penalty_saved(success, algorithm_name)
+        )
     
     # time_id: int, unique ID of the time entry (int for DB key)
     # algorithm_name: str, name of the algorithm (str for search)
@@ -410,15 +559,28 @@ class TimerListCard(DashboardCard):
         Output: None
         """
         new_dnf = not current_dnf
+        callback = lambda success: self._on_penalty_saved(success, algorithm_name)
         # If setting DNF, remove +2 penalty
         if new_dnf:
-            self.timer_util.update_time_penalty(time_id, plus_two=False, dnf=True)
+            self.timer_util.update_time_penalty_async(time_id, plus_two=False, dnf=True, callback=callback)
         else:
-            self.timer_util.update_time_penalty(time_id, dnf=False)
-        
-        self.update_times(algorithm_name)
-        if self.dashboard:
-            self.dashboard.on_algorithm_select(algorithm_name)
+            self.timer_util.update_time_penalty_async(time_id, dnf=False, callback=callback)
+    
+    # success: bool, whether the penalty update was committed
+    # algorithm_name: str, name of the algorithm (str for search)
+    # Returns: None
+    def _on_penalty_saved(self, success: bool, algorithm_name: str):
+        """
+        Function: Refresh the dashboard once the background writer has saved a penalty
+        Input: success (bool), algorithm_name (str)
+        Output: None
+        """
+        if not success or not self.winfo_exists():
+            return
+        # The save finishes a moment later, don't jump back if another algorithm was selected meanwhile
+        if self.dashboard and self.dashboard.selected_algorithm != algorithm_name:
+            return
+        self._refresh(algorithm_name)
     
     # time_id: int, unique ID of the time entry (int for DB key)
     # algorithm_name: str, name of the algorithm (str for search)
@@ -430,10 +592,20 @@ class TimerListCard(DashboardCard):
         Output: None
         """
         if self.timer_util.delete_time(time_id):
-            self.update_times(algorithm_name)
-            # Update other dashboard cards
-            if self.dashboard:
-                self.dashboard.on_algorithm_select(algorithm_name)
+            self._refresh(algorithm_name)
+
+    # algorithm_name: str, name of the algorithm whose times changed
+    # Returns: None
+    def _refresh(self, algorithm_name: str):
+        """
+        Function: Reload the algorithm once and refresh every dashboard card (or just this card without a dashboard)
+        Input: algorithm_name (str)
+        Output: None
+        """
+        if self.dashboard:
+            self.dashboard.on_algorithm_select(algorithm_name)
+        else:
+            self.update_times(DashboardSnapshot.load(algorithm_name))
 
     def reset_to_default(self):
         """
@@ -467,29 +639,25 @@ class StatsCard(DashboardCard):
         self.default_label = ctk.CTkLabel(self.main_frame, text="Select an algorithm to view statistics", font=(FONT, 14), text_color="gray")
         self.default_label.pack(expand=True)
     
-    # algorithm_name: str, name of the algorithm to display stats for (str for search)
+    # snapshot: DashboardSnapshot, data of the algorithm to display stats for
     # Returns: None
-    def update_stats(self, algorithm_name: str) -> None:
+    def update_stats(self, snapshot: DashboardSnapshot) -> None:
         """
         Function: Update the statistics display for the selected algorithm
-        Input: algorithm_name (str)
+        Input: snapshot (DashboardSnapshot)
         Output: None
         """
         # Clear existing widgets
         for widget in self.main_frame.winfo_children():
             widget.destroy()
         
-        # Get times for the algorithm
-        times_data = self.timer_util.get_algorithm_times(algorithm_name)
+        # Stored statistics for the algorithm
+        stats = snapshot.stats
         
-        if not times_data:
+        if not stats:
             no_stats_label = ctk.CTkLabel(self.main_frame, text="No statistics available", font=(FONT, 14), text_color="gray")
             no_stats_label.pack(expand=True)
             return
-        
-        # Calculate statistics
-        times_only = [time for time, _ in times_data]
-        stats = self.timer_util.get_time_statistics(times_data)
                 
         # PB and average row
         top_row = ctk.CTkFrame(self.main_frame, fg_color="transparent")
@@ -513,108 +681,55 @@ class StatsCard(DashboardCard):
         average_value = ctk.CTkLabel(average_frame, text=f"{stats['average']:.2f}" if stats else "N/A", font=(FONT, 36, "bold"))
         average_value.pack(pady=(0, 15))
         
-        # Calculate ao5 and ao12
-        ao5_pb = self._calculate_best_average(times_only, 5)
-        ao5_current = self._calculate_current_average(times_only, 5)
-        ao12_pb = self._calculate_best_average(times_only, 12)
-        ao12_current = self._calculate_current_average(times_only, 12)
-        
-        # Bottom section
-        bottom_frame = ctk.CTkFrame(self.main_frame, fg_color="transparent")
-        bottom_frame.pack(fill="x", pady=(5, 0))
-        
-        # ao5 pb
-        ao5_pb_frame = ctk.CTkFrame(bottom_frame, fg_color="#2D2F35", corner_radius=8)
-        ao5_pb_frame.pack(side="left", expand=True, fill="both", padx=(0, 2))
-        
-        ao5_pb_label = ctk.CTkLabel(ao5_pb_frame, text="ao5 pb", font=(FONT, 12), text_color="gray")
-        ao5_pb_label.pack(pady=(12, 0))
-        ao5_pb_value = ctk.CTkLabel(ao5_pb_frame, text=f"{ao5_pb:.2f}" if ao5_pb else "N/A", font=(FONT, 20, "bold"))
-        ao5_pb_value.pack(pady=(0, 12))
-        
-        # ao5
-        ao5_frame = ctk.CTkFrame(bottom_frame, fg_color="#2D2F35", corner_radius=8)
-        ao5_frame.pack(side="right", expand=True, fill="both", padx=(2, 0))
-        
-        ao5_label = ctk.CTkLabel(ao5_frame, text="ao5", font=(FONT, 12), text_color="gray")
-        ao5_label.pack(pady=(12, 0))
-        ao5_value = ctk.CTkLabel(ao5_frame, text=f"{ao5_current:.2f}" if ao5_current else "N/A", font=(FONT, 20, "bold"))
-        ao5_value.pack(pady=(0, 12))
-        
-        # Spacer
-        spacer = ctk.CTkFrame(self.main_frame, fg_color="transparent", height=5)
-        spacer.pack(fill="x")
-        
-        # ao12 row
-        ao12_row = ctk.CTkFrame(self.main_frame, fg_color="transparent")
-        ao12_row.pack(fill="x")
-        
-        # ao12 pb  
-        ao12_pb_frame = ctk.CTkFrame(ao12_row, fg_color="#2D2F35", corner_radius=8)
-        ao12_pb_frame.pack(side="left", expand=True, fill="both", padx=(0, 2))
-        
-        ao12_pb_label = ctk.CTkLabel(ao12_pb_frame, text="ao12 pb", font=(FONT, 12), text_color="gray")
-        ao12_pb_label.pack(pady=(12, 0))
-        ao12_pb_value = ctk.CTkLabel(ao12_pb_frame, text=f"{ao12_pb:.2f}" if ao12_pb else "N/A", font=(FONT, 20, "bold"))
-        ao12_pb_value.pack(pady=(0, 12))
-        
-        # ao12
-        ao12_frame = ctk.CTkFrame(ao12_row, fg_color="#2D2F35", corner_radius=8)
-        ao12_frame.pack(side="right", expand=True, fill="both", padx=(2, 0))
-        
-        ao12_label = ctk.CTkLabel(ao12_frame, text="ao12", font=(FONT, 12), text_color="gray")
-        ao12_label.pack(pady=(12, 0))
-        ao12_value = ctk.CTkLabel(ao12_frame, text=f"{ao12_current:.2f}" if ao12_current else "N/A", font=(FONT, 20, "bold"))
-        ao12_value.pack(pady=(0, 12))
-    
-    # times: list, list of times (float) to average (list for multiple values)
-    # count: int, number of solves to average (int for window size)
-    # Returns: float or None (best average or None if not enough times)
-    def _calculate_best_average(self, times: list, count: int):
-        """
-        Function: Calculate the best average for an algorithm
-        Input: times: list, list of times (float) to average, count: int, number of solves to average
-        Outputs: float or None (best average or None if not enough times)
-        """
-        if len(times) < count:
-            return None
-        
-        best_average = float('inf')
-        for i in range(len(times) - count + 1):
-            window = times[i:i+count]
-            # Remove best and worst for average calculation (standard cubing practice for calculating averages)
-            if count >= 3:
-                sorted_window = sorted(window)
-                average_times = sorted_window[1:-1] # Remove best and worst
-                average = sum(average_times) / len(average_times)
-            else:
-                average = sum(window) / len(window)
-            
-            if average < best_average:
-                best_average = average
+        # Median and 90th percentile of the valid times
+        self._add_pair_row(("median", stats['median']), ("p90", stats['p90']), pady=(0, 5))
+        
+        # PBs are stored, the current averages only need the last 100 solves (DNFs count, WCA style)
+        sizes = self.timer_util.CACHED_AVERAGES
+        recent_results = snapshot.recent_results(max(sizes))
         
-        return best_average if best_average != float('inf') else None
+        for index, size in enumerate(sizes):
+            current = AverageStats.best_and_current(recent_results[-size:], size)[1]
+            if index:
+                # Spacer
+                spacer = ctk.CTkFrame(self.main_frame, fg_color="transparent", height=5)
+                spacer.pack(fill="x")
+            self._add_average_row(size, stats[f'ao{size}_pb'], current, pady=(5, 0) if index == 0 else 0)
     
-    # times: list, list of times (float) to average (list for multiple values)
-    # count: int, number of solves to average (int for window size)
-    # Returns: float or None (current average or None if not enough times)
-    def _calculate_current_average(self, times: list, count: int):
-        """
-        Function: Calculate the current average of the last 5 solves
-        Input: times: list, list of times (float) to average, count: int, number of solves to average
-        Outputs: float or None (best average or None if not enough times)
-        """
-        if len(times) < count:
-            return None
-        
-        recent_times = times[:count]  # Get most recent times
-        # Remove best and worst for average calculation
-        if count >= 3:
-            sorted_times = sorted(recent_times)
-            average_times = sorted_times[1:-1]  # Remove best and worst
-            return sum(average_times) / len(average_times)
-        else:
-            return sum(recent_times) / len(recent_times)
+    # size: int, number of solves in the average (int for the label)
+    # pb: float or None, best average (DNF for a DNF average)
+    # current: float or None, most recent average
+    # pady: int or tuple, vertical padding of the row
+    # Returns: None
+    def _add_average_row(self, size: int, pb, current, pady=0) -> None:
+        """
+        Function: Add a row with an average's PB on the left and its current value on the right
+        Input: size (int), pb (float or None), current (float or None), pady (int or tuple)
+        Outputs: None
+        """
+        self._add_pair_row((f"ao{size} pb", pb), (f"ao{size}", current), pady)
+
+    # left: tuple (title: str, value: float or None), shown on the left
+    # right: tuple (title: str, value: float or None), shown on the right
+    # pady: int or tuple, vertical padding of the row
+    # Returns: None
+    def _add_pair_row(self, left: tuple, right: tuple, pady=0) -> None:
+        """
+        Function: Add a row of two titled values
+        Input: left (tuple), right (tuple), pady (int or tuple)
+        Outputs: None
+        """
+        row = ctk.CTkFrame(self.main_frame, fg_color="transparent")
+        row.pack(fill="x", pady=pady)
+        
+        for side, (title, value), padx in (("left", left, (0, 2)), ("right", right, (2, 0))):
+            frame = ctk.CTkFrame(row, fg_color="#2D2F35", corner_radius=8)
+            frame.pack(side=side, expand=True, fill="both", padx=padx)
+            
+            label = ctk.CTkLabel(frame, text=title, font=(FONT, 12), text_color="gray")
+            label.pack(pady=(12, 0))
+            value_label = ctk.CTkLabel(frame, text=AverageStats.format_result(value), font=(FONT, 20, "bold"))
+            value_label.pack(pady=(0, 12))
 
     def reset_to_default(self) -> None:
         for widget in self.content_frame.winfo_children():
@@ -628,137 +743,202 @@ class StatsCard(DashboardCard):
         )
         label.pack(expand=True, fill="both")
 
-class LineChartCard(DashboardCard):
+class LineChartCard(ChartCard):    
+    # Markers are only drawn when every solve in view fits in the point budget
+    MARKER_LIMIT = 100
+    # Rolling averages drawn over the times, and their colours
+    TREND_SIZES = {5: '#FFB347', 12: '#7CD992', 100: '#FF6B6B'}
+    # Valid solves needed before the weekly mean from the rollups is drawn, shorter histories show it well enough
+    WEEKLY_TREND_MIN = 500
+
     # parent: CTk widget, container for the card (CTkFrame for layout flexibility)
     # **kwargs: dict, allows passing extra options to CTkFrame (flexible for UI)
     # Returns: None
     def __init__(self, parent, **kwargs):
         super().__init__(parent, **kwargs)
-        self.timer_util = TimerUtil()
-        self.canvas = None
-        self.fig = None
-        self.ax = None
-        self._resize_after_id = None
-        self._resize_bound = False
+        # times (numpy array): every valid time oldest first, the line only draws a downsampled part of it
+        self.times = np.empty(0, dtype=np.float64)
+        # trends (dict of int to (x, y) arrays): each rolling average at the position of its last valid solve
+        self.trends = {}
+        # weekly (tuple of x, y arrays): each week's mean at the position of the last valid solve in that week
+        self.weekly = (np.empty(0), np.empty(0))
+        # results and averages from the last draw, so a history that only grew only sorts its new windows
+        self._results = None
+        self._averages = {}
         self.setup_ui()
 
     def setup_ui(self) -> None:
-        self.create_chart([])
+        # The lines are made once, updates only change their data
+        self.line, = self.ax.plot([], [], color='#4A9EFF', linewidth=2, marker='o', markersize=3)
+        self.trend_lines = {
+            size: self.ax.plot([], [], color=colour, linewidth=1.5, label=f'ao{size}')[0]
+            for size, colour in LineChartCard.TREND_SIZES.items()
+        }
+        self.weekly_line, = self.ax.plot([], [], color='#DDDDDD', linewidth=1.5, linestyle='--', label='weekly mean')
+        self.legend = self.ax.legend(handles=[*self.trend_lines.values(), self.weekly_line], loc='upper right',
+                                     fontsize=6, frameon=False, labelcolor='gray')
+        self.ax.set_ylabel('Time (s)', color='gray', fontsize=8)
+        self.ax.set_xlabel('Solve', color='gray', fontsize=8)
+        self.create_chart(None)
 
-    # times_data: list, list of (time, ...) tuples for chart (list for multiple times)
+    # data: tuple (results: numpy array, epochs: numpy array, weekly: tuple) or None, every result oldest first
+    #       (+2 added, DNF as infinity), their timestamps in Unix seconds and the weekly rollups
     # Returns: None
-    def create_chart(self, times_data: list) -> None:
+    def draw_chart(self, data) -> None:
         """
-        Function: Create or update the line graph
-        Input: times_data (list), list of times, tuples for chart
+        Function: Update the times, rolling average and weekly mean lines (runs on the render thread)
+        Input: data (tuple or None), results in chronological order with their timestamps and weekly rollups
         Outputs: None
         """
-        # Clear existing chart widget
-        for widget in self.winfo_children():
-            widget.destroy()
-        # Close existing fig if any
-        try:
-            if self.fig is not None:
-                plt.close(self.fig)
-        except Exception:
-            pass
+        results, epochs, weekly = data if data is not None else ((), (), ())
+        results = np.asarray(results, dtype=np.float64)
+        valid = np.isfinite(results)
+        self.times = results[valid]
+        self.weekly = self._weekly_trend(np.asarray(epochs, dtype=np.int64)[valid], weekly)
 
-        # Create matplotlib figure
-        fig, ax = plt.subplots(figsize=(3, 2.5), facecolor='#33363D', constrained_layout=True)
-        fig.set_dpi(100)
-        ax.set_facecolor('#33363D')
-        self.fig, self.ax = fig, ax
-
-        if times_data and len(times_data) > 1:
-            # Get times in chronological order
-            times = [float(t[0]) for t in reversed(times_data)]
-            x = range(len(times))
-
-            # Create line chart
-            ax.plot(x, times, color='#4A9EFF', linewidth=2, marker='o', markersize=3)
-
-            ax.set_ylabel('Time (s)', color='gray', fontsize=8)
-            ax.set_xlabel('Solve', color='gray', fontsize=8)
-            ax.tick_params(axis='x', colors='gray', labelcolor='gray')
-            ax.tick_params(axis='y', colors='gray', labelcolor='gray')
-            fig.canvas.draw()
-            for label in ax.get_xticklabels():
-                label.set_color('gray')
-            for label in ax.get_yticklabels():
-                label.set_color('gray')
-
-            min_time, max_time = min(times), max(times)
+        # Averages end at a solve, draw each at the last valid solve so far (DNF averages are left out)
+        positions = np.cumsum(valid) - 1
+        self.trends = {}
+        for size, averages in self._rolling_averages(results).items():
+            finite = np.isfinite(averages)
+            self.trends[size] = (positions[size - 1:][finite], averages[finite])
+
+        has_data = len(self.times) > 1
+        if has_data:
+            self.ax.set_xlim(-0.5, len(self.times) - 0.5)
+
+            min_time, max_time = float(self.times.min()), float(self.times.max())
             padding = (max_time - min_time) * 0.1 if max_time > min_time else 1
-            ax.set_ylim(max(0, min_time - padding), max_time + padding)
+            self.ax.set_ylim(max(0, min_time - padding), max_time + padding)
         else:
-            # Show empty state
-            ax.text(0.5, 0.5, 'No Data', transform=ax.transAxes,
-                    ha='center', va='center', color='gray', fontsize=12)
-            # Ensure that the labels are gray (are black when no data is present)
-            ax.tick_params(axis='x', colors='gray', labelcolor='gray')
-            ax.tick_params(axis='y', colors='gray', labelcolor='gray')
-            self.fig.canvas.draw()
-            for label in ax.get_xticklabels():
-                label.set_color('gray')
-            for label in ax.get_yticklabels():
-                label.set_color('gray')
+            self.ax.set_xlim(0, 1)
+            self.ax.set_ylim(0, 1)
 
-        # Remove spines
-        for spine in ax.spines.values():
-            spine.set_visible(False)
+        self.line.set_visible(has_data)
+        for size, trend_line in self.trend_lines.items():
+            trend_line.set_visible(has_data and len(self.trends[size][0]) > 1)
+        self.weekly_line.set_visible(has_data and len(self.weekly[0]) > 1)
+        self.weekly_line.set_data(*self.weekly)
+        lines = [*self.trend_lines.values(), self.weekly_line]
+        self.legend.set_visible(has_data and any(line.get_visible() for line in lines))
+        self.ax.xaxis.label.set_visible(has_data)
+        self.ax.yaxis.label.set_visible(has_data)
+        self._show_data(has_data)
+        self._resample()
 
-        # Grid
-        ax.grid(True, alpha=0.3, color='gray')
-        ax.set_axisbelow(True)
+    # results: numpy array, every result oldest first (DNF as infinity)
+    # Returns: dict of int to numpy array, AveragesEngine.rolling for each trend size
+    def _rolling_averages(self, results) -> dict:
+        """
+        Function: Rolling averages for the trend lines, only computing the new windows when solves were just added
+        Input: results (array)
+        Outputs: Dictionary of size to averages
+        """
+        previous = self._results
+        grown = (previous is not None and len(previous) <= len(results)
+                 and np.array_equal(previous, results[:len(previous)]))
+        averages = {}
+        for size in LineChartCard.TREND_SIZES:
+            if grown:
+                averages[size] = AveragesEngine.extend_rolling(self._averages[size], results, size)
+            else:
+                averages[size] = AveragesEngine.rolling(results, size)
+        self._results = results
+        self._averages = averages
+        return averages
 
-        # Embed in tkinter
-        self.canvas = FigureCanvasTkAgg(fig, self)
-        self.canvas.draw()
-        self.canvas.get_tk_widget().pack(fill="both", expand=True, padx=10, pady=10)
+    # epochs: numpy array of int64, timestamps of the valid solves in Unix seconds, oldest first
+    # weekly: tuple, rows from TimerUtil.get_rollups(name, 'week')
+    # Returns: tuple (x, y) of numpy arrays, the weekly means to draw (empty for short histories)
+    def _weekly_trend(self, epochs, weekly) -> tuple:
+        """
+        Function: Place each week's mean at the last valid solve before the week ended, reading one rollup row
+                  per week instead of every solve
+        Input: epochs (array), weekly (tuple)
+        Outputs: Tuple of x and y arrays
+        """
+        means = [(bucket, mean) for bucket, _, _, mean, _, _, _ in weekly if mean is not None]
+        if len(epochs) < LineChartCard.WEEKLY_TREND_MIN or not means:
+            return np.empty(0), np.empty(0)
+        buckets, y = zip(*means)
+        # Buckets are the UTC dates the weeks start on, like the stored timestamps
+        week_ends = (np.array(buckets, dtype='datetime64[D]') + 7).astype('datetime64[s]').astype(np.int64)
+        # Imported times can be out of order, so count the solves before each week's end rather than search by id
+        x = np.searchsorted(np.sort(epochs), week_ends, side='left') - 1
+        return x.astype(np.float64), np.array(y, dtype=np.float64)
 
-    def destroy(self) -> None:
+    def _resample(self) -> None:
         """
-        Function: Clean up matplotlib resources
+        Function: Draw the solves in view, downsampled to about one point per pixel of the axes width
         Input: None
         Outputs: None
         """
-        try:
-            if hasattr(self, 'canvas') and self.canvas:
-                self.canvas.get_tk_widget().destroy()
-                self.canvas = None
-            self.fig = None
-            self.ax = None
-            plt.close('all')
-        except Exception:
-            pass
-        super().destroy()
+        if len(self.times) <= 1:
+            self.line.set_data([], [])
+            for trend_line in self.trend_lines.values():
+                trend_line.set_data([], [])
+            return
+
+        # Solves in view, one either side so the line runs to the edges
+        low, high = self.ax.get_xlim()
+        start = max(0, int(np.floor(low)) - 1)
+        end = min(len(self.times), int(np.ceil(high)) + 2)
+        budget = max(3, int(self.ax.bbox.width))
+
+        x = np.arange(start, end)
+        y = self.times[start:end]
+        keep = Downsampler.lttb(x, y, budget)
+        self.line.set_data(x[keep], y[keep])
+        self.line.set_marker('o' if len(y) <= min(budget, LineChartCard.MARKER_LIMIT) else '')
+
+        for size, trend_line in self.trend_lines.items():
+            trend_x, trend_y = self.trends[size]
+            first, last = np.searchsorted(trend_x, [start, end])
+            keep = Downsampler.lttb(trend_x[first:last], trend_y[first:last], budget)
+            trend_line.set_data(trend_x[first:last][keep], trend_y[first:last][keep])
 
-    # algorithm_name: str, name of the algorithm to update chart for (str for search)
+    # snapshot: DashboardSnapshot, data of the algorithm to update chart for
     # Returns: None
-    def update_algorithm(self, algorithm_name: str) -> None:
+    def update_algorithm(self, snapshot: DashboardSnapshot) -> None:
         """"
         Function: Update card with algorithm data
-        Input: algorithm_name (str), name of the algorithm to display
+        Input: snapshot (DashboardSnapshot), data of the algorithm to display
         Outputs: None
         """
         try:
-            times_data = self.timer_util.get_algorithm_times(algorithm_name)
-            self.create_chart(times_data)
+            self.create_chart((snapshot.results(), snapshot.epochs(), snapshot.weekly), snapshot.data_version())
         except Exception:
-            self.create_chart([])
+            self.create_chart(None)
 
     def reset_to_default(self) -> None:
-        self.create_chart([])
+        self.create_chart(None)
 
 class Dashboard:    
+    # Milliseconds between checks for a finished background load
+    LOAD_POLL_MS = 15
+
     # parent_frame: CTkFrame, main container for dashboard (CTkFrame for layout)
     # on_back: function, callback for back button (function for navigation)
     # Returns: None
     def __init__(self, parent_frame: ctk.CTkFrame, on_back) -> None:
         self.parent_frame = parent_frame
         self.on_back = on_back
+        # Snapshots are read on a worker thread, only the latest selection is shown
+        self.loader = LatestOnlyLoader("cubelab-dashboard")
+        self._load_poll_id = None
+        # selected_algorithm (str or None): algorithm the cards are showing or loading
+        self.selected_algorithm = None
         
         self.setup_ui()
+    
+    def go_back(self) -> None:
+        """
+        Function: Stop background loading and leave the dashboard
+        Input: None
+        Output: None
+        """
+        self.loader.shutdown()
+        self.on_back()
 
     def setup_ui(self) -> None:
         # Configure grid
@@ -770,7 +950,7 @@ class Dashboard:
         self.header = HeaderFrame(
             self.parent_frame,
             show_back=True,
-            on_back=self.on_back,
+            on_back=self.go_back,
             on_exit=self.exit_app
         )
         self.header.grid(row=0, column=0, sticky="ew")
@@ -864,8 +1044,10 @@ class Dashboard:
         Input: algorithm_name (str) for search, None for reset
         Output: None
         """
+        self.selected_algorithm = algorithm_name
         if algorithm_name is None:
             # No algorithm selected then reset all cards to default state
+            self.loader.cancel()
             self.algorithm_card.reset_to_default()
             self.tags_card.reset_to_default()
             self.timer_list_card.reset_to_default()
@@ -873,13 +1055,44 @@ class Dashboard:
             self.bar_chart_card.reset_to_default()
             self.line_chart_card.reset_to_default()
         else:
-            # Update all cards with data for the selected algorithm
-            self.algorithm_card.update_algorithm(algorithm_name)
-            self.tags_card.update_tags(algorithm_name)
-            self.timer_list_card.update_times(algorithm_name)
-            self.stats_card.update_stats(algorithm_name)
-            self.bar_chart_card.update_algorithm(algorithm_name)
-            self.line_chart_card.update_algorithm(algorithm_name)
+            # Read the algorithm on the worker thread, replacing a load that has not started yet
+            self.loader.submit(DashboardSnapshot.load, algorithm_name)
+            if self._load_poll_id is None:
+                self._load_poll_id = self.content_frame.after(self.LOAD_POLL_MS, self._poll_snapshot)
+    
+    def _poll_snapshot(self) -> None:
+        """
+        Function: Show the latest snapshot once the worker has loaded it, checking again until it has
+        Input: None
+        Output: None
+        """
+        self._load_poll_id = None
+        if not self.content_frame.winfo_exists():
+            return
+        try:
+            done, snapshot = self.loader.poll()
+        except Exception as e:
+            print(f"Error loading dashboard data: {e}")
+            return
+        if done:
+            self.show_snapshot(snapshot)
+        elif self.loader.pending():
+            self._load_poll_id = self.content_frame.after(self.LOAD_POLL_MS, self._poll_snapshot)
+    
+    # snapshot: DashboardSnapshot, data of the selected algorithm
+    # Returns: None
+    def show_snapshot(self, snapshot: DashboardSnapshot) -> None:
+        """
+        Function: Give the same snapshot to every card
+        Input: snapshot (DashboardSnapshot)
+        Output: None
+        """
+        self.algorithm_card.update_algorithm(snapshot)
+        self.tags_card.update_tags(snapshot)
+        self.timer_list_card.update_times(snapshot)
+        self.stats_card.update_stats(snapshot)
+        self.bar_chart_card.update_algorithm(snapshot)
+        self.line_chart_card.update_algorithm(snapshot)
 
     def exit_app(self) -> None:
         """
@@ -888,14 +1101,9 @@ class Dashboard:
         Output: None
         """
         try:
-            import matplotlib.pyplot as plt
-            plt.close('all')
-            
-            if hasattr(self.bar_chart_card, 'canvas') and self.bar_chart_card.canvas:
-                self.bar_chart_card.canvas.get_tk_widget().destroy()
-            if hasattr(self.line_chart_card, 'canvas') and self.line_chart_card.canvas:
-                self.line_chart_card.canvas.get_tk_widget().destroy()
-                
+            # Commit any writes still waiting in the background writer
+            self.loader.shutdown()
+            TimerUtil().flush_writes()
         except Exception as e:
             print(f"Error during dashboard cleanup: {e}")
         finally:
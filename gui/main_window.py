@@ -3,18 +3,23 @@
 #   File: gui/main_window.py
 
 import customtkinter as ctk
+import importlib
 import os
+import threading
 from PIL import Image
 from .components import HeaderFrame, FONT
 from .algorithm_list import AlgorithmList
 from .algorithm_details import AlgorithmDetails
 from .stopwatch_widget import StopwatchWidget
 from .modals import AddAlgorithmModal
-from .dashboard import Dashboard
+from classes.timer_util import TimerUtil
 
 class MainWindow:
     """Main application window"""
     
+    # Milliseconds after start up before the dashboard's modules (matplotlib, NumPy) are imported in the background
+    WARM_IMPORTS_MS = 1500
+    
     def __init__(self, parent_frame: ctk.CTkFrame):
         """
         Function: Initialise the main window
@@ -30,7 +35,33 @@ class MainWindow:
         self.stopwatch_widget = None
         self.dashboard = None
         
+        self.timer_util = TimerUtil()
+        
         self.draw_main_ui()
+        self._poll_write_results()
+        # The dashboard is imported when it is first shown, warm it once the timer is up so that is quick too
+        self.parent_frame.after(MainWindow.WARM_IMPORTS_MS, self._warm_dashboard_imports)
+    
+    def _poll_write_results(self):
+        """
+        Function: Run callbacks for times saved by the background writer, every 50 milliseconds
+        Input: None
+        Outputs: None
+        """
+        self.timer_util.dispatch_write_results()
+        self.parent_frame.after(50, self._poll_write_results)
+    
+    def _warm_dashboard_imports(self):
+        """
+        Function: Import the dashboard module on a background thread, so the first show_dashboard does not wait for matplotlib
+        Input: None
+        Outputs: None
+        """
+        # Importing does not touch Tk, and if show_dashboard imports it first the import lock makes it wait for this one
+        threading.Thread(
+            target=importlib.import_module, args=(f"{__package__}.dashboard",),
+            name="cubelab-warm-imports", daemon=True
+        ).start()
     
     def clear_parent_frame(self):
         """
@@ -154,7 +185,11 @@ class MainWindow:
         self.current_view = "dashboard"
         self.clear_parent_frame()
         
-        # Create dashboard
+        # Make sure the dashboard sees every time saved so far
+        self.timer_util.flush_writes()
+        
+        # Create dashboard (imported here so matplotlib and NumPy are not loaded before the timer is shown)
+        from .dashboard import Dashboard
         self.dashboard = Dashboard(
             self.parent_frame,
             on_back=self.draw_main_ui
@@ -167,21 +202,8 @@ class MainWindow:
         Outputs: None
         """
         try:
-            # Clean up any matplotlib figures that might exist
-            import matplotlib.pyplot as plt
-            plt.close('all')
-            
-            if hasattr(self, 'dashboard'):
-                try:
-                    if hasattr(self.dashboard, 'bar_chart_card') and hasattr(self.dashboard.bar_chart_card, 'canvas'):
-                        if self.dashboard.bar_chart_card.canvas:
-                            self.dashboard.bar_chart_card.canvas.get_tk_widget().destroy()
-                    if hasattr(self.dashboard, 'line_chart_card') and hasattr(self.dashboard.line_chart_card, 'canvas'):
-                        if self.dashboard.line_chart_card.canvas:
-                            self.dashboard.line_chart_card.canvas.get_tk_widget().destroy()
-                except:
-                    pass
-                    
+            # Commit any times still waiting in the background writer
+            self.timer_util.flush_writes()
         except Exception as e:
             print(f"Error during cleanup: {e}")
         finally:
@@ -136,20 +136,8 @@ class AddAlgorithmModal:
         if not notation:
             return False
         
-        valid_moves = {
-            'U', 'D', 'L', 'R', 'F', 'B', # base moves
-            'U2', 'D2', 'L2', 'R2', 'F2', 'B2', # 2 moves
-            "U'", "D'", "L'", "R'", "F'", "B'", # prime moves
-            "U2'", "D2'", "L2'", "R2'", "F2'", "B2'" # 2 prime moves
-        }
-        
-        # Split by spaces and check each move (convert to uppercase for validation)
-        moves = notation.split()
-        invalid_moves = []
-        
-        for move in moves:
-            if move.upper() not in valid_moves:
-                invalid_moves.append(move)
+        # Split by spaces and check each move (same rules as the bulk importer)
+        invalid_moves = Algorithm.find_invalid_moves(notation)
         
         if event is not None:
             if invalid_moves:
@@ -174,15 +162,14 @@ class AddAlgorithmModal:
             self.message_var.set("Name and notation are required")
             return
         # Limit algorithm name to 32 chars
-        if len(name) > 32:
-            self.message_var.set("Algorithm name must be maximum 32 characters")
+        if len(name) > Algorithm.MAX_NAME_LENGTH:
+            self.message_var.set(f"Algorithm name must be maximum {Algorithm.MAX_NAME_LENGTH} characters")
             return
         if not self._validate_notation():
             self.message_var.set("Invalid notation. Must use U, D, L, R, F, B with modifiers 2 and/or ' (separated by spaces)")
             return
         
         # Check if algorithm already exists
-        from classes.algorithm import Algorithm
         service = Algorithm()
         if service.algorithm_exists(name):
             self.message_var.set("Name already exists")
@@ -192,14 +179,14 @@ class AddAlgorithmModal:
         tags = [t.strip() for t in tags_raw.split(",") if t.strip()]
         
         # Limit to 10 tags
-        if len(tags) > 10:
-            self.message_var.set("Maximum 10 tags allowed")
+        if len(tags) > Algorithm.MAX_TAGS:
+            self.message_var.set(f"Maximum {Algorithm.MAX_TAGS} tags allowed")
             return
         
         # Check tag length (max 16 characters each)
         for tag in tags:
-            if len(tag) > 16:
-                self.message_var.set("Each tag must be 16 characters or less")
+            if len(tag) > Algorithm.MAX_TAG_LENGTH:
+                self.message_var.set(f"Each tag must be {Algorithm.MAX_TAG_LENGTH} characters or less")
                 return
         
         # Convert notation to uppercase for consistency
@@ -372,20 +359,8 @@ class EditAlgorithmModal:
         if not notation:
             return False
         
-        valid_moves = {
-            'U', 'D', 'L', 'R', 'F', 'B', # base moves
-            'U2', 'D2', 'L2', 'R2', 'F2', 'B2', # 2 moves
-            "U'", "D'", "L'", "R'", "F'", "B'", # prime moves
-            "U2'", "D2'", "L2'", "R2'", "F2'", "B2'" # 2 prime moves
-        }
-        
-        # Split by spaces and check each move (convert to uppercase for validation)
-        moves = notation.split()
-        invalid_moves = []
-        
-        for move in moves:
-            if move.upper() not in valid_moves:
-                invalid_moves.append(move)
+        # Split by spaces and check each move (same rules as the bulk importer)
+        invalid_moves = Algorithm.find_invalid_moves(notation)
         
         if event is not None:
             if invalid_moves:
@@ -410,8 +385,8 @@ class EditAlgorithmModal:
             self.message_var.set("Name and notation are required")
             return
         # Limit algorithm name to 32 chars
-        if len(name) > 32:
-            self.message_var.set("Algorithm name must be maximum 32 characters")
+        if len(name) > Algorithm.MAX_NAME_LENGTH:
+            self.message_var.set(f"Algorithm name must be maximum {Algorithm.MAX_NAME_LENGTH} characters")
             return
         if not self._validate_notation():
             self.message_var.set("Invalid notation. Must use U, D, L, R, F, B with modifiers 2 and/or ' (separated by spaces)")
@@ -427,14 +402,14 @@ class EditAlgorithmModal:
         tags = [t.strip() for t in tags_raw.split(",") if t.strip()]
         
         # Limit to 10 tags
-        if len(tags) > 10:
-            self.message_var.set("Maximum 10 tags allowed")
+        if len(tags) > Algorithm.MAX_TAGS:
+            self.message_var.set(f"Maximum {Algorithm.MAX_TAGS} tags allowed")
             return
         
         # Check tag length (max 16 characters each)
         for tag in tags:
-            if len(tag) > 16:
-                self.message_var.set("Each tag must be 16 characters or less")
+            if len(tag) > Algorithm.MAX_TAG_LENGTH:
+                self.message_var.set(f"Each tag must be {Algorithm.MAX_TAG_LENGTH} characters or less")
                 return
         
         # Convert notation to uppercase for consistency
@@ -101,14 +101,28 @@ class StopwatchWidget(ctk.CTkFrame):
             # Stop the timer
             elapsed = self.stopwatch.stop()
             if elapsed > 0:
-                success = self.timer_util.save_time(self.selected_algorithm, elapsed)
-                if success:
-                    pass
+                # Saved by the background writer so a slow disk never holds up the next solve
+                self.timer_util.save_time_async(
+                    self.selected_algorithm, elapsed,
+                    callback=lambda success, name=self.selected_algorithm: self._on_time_saved(name, success)
+                )
         else:
             # Start hold
             self.stopwatch.start_hold()
             self._check_hold_duration()
     
+    # algorithm_name: str, algorithm the time was saved for
+    # success: bool, whether the time was committed
+    # No return
+    def _on_time_saved(self, algorithm_name, success):
+        """
+        Function: Handle the background writer finishing a save
+        Input: algorithm_name (str), success (bool)
+        Outputs: None (shows an error if the time could not be saved)
+        """
+        if not success and self.winfo_exists():
+            self.target_var.set(f"Could not save time for {algorithm_name}")
+    
     # event: Keyboard event object, required for event handling
     # No return
     def on_space_release(self, event: None):
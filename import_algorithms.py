@@ -0,0 +1,34 @@
+import argparse
+import sys
+from classes.algorithm import Algorithm
+from classes.importer import AlgorithmImporter
+from database import init_db
+
+def main():
+    """Import an algorithm set (CSV, TSV, JSON or JSON Lines) into the database."""
+    parser = argparse.ArgumentParser(description="Import an algorithm set into CubeLab.")
+    parser.add_argument("path", help="file with name, notation and tags for each algorithm")
+    parser.add_argument("--format", choices=["csv", "tsv", "json", "jsonl"], help="file format (default: from the file extension)")
+    parser.add_argument("--db", default=Algorithm.db_path, help="database file (default: %(default)s)")
+    args = parser.parse_args()
+
+    Algorithm.db_path = args.db
+    init_db(args.db)
+
+    def show_progress(rows_read, imported):
+        print(f"\rRead {rows_read} rows, imported {imported}", end="", flush=True)
+
+    try:
+        report = AlgorithmImporter().import_file(args.path, args.format, on_progress=show_progress)
+    except (OSError, ValueError) as e:
+        print(f"Import failed, nothing was saved: {e}", file=sys.stderr)
+        return 1
+    print()
+
+    for row_number, message in report["errors"]:
+        print(f"Row {row_number}: {message}", file=sys.stderr)
+    print(f"Imported {report['imported']} of {report['rows']} algorithms ({len(report['errors'])} skipped)")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())